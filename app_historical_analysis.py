@@ -13,6 +13,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.services.historical_analysis_v2 import HistoricalAnalysisV2
 from src.visualization.historical_visualizer import HistoricalVisualizer
+from src.serialization import json_loads
 
 # 页面配置
 st.set_page_config(
@@ -249,9 +250,8 @@ def display_data_status():
             file_path = os.path.join(cache_dir, platform, f"{keyword}.json")
             if os.path.exists(file_path):
                 try:
-                    import json
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
+                    with open(file_path, 'rb') as f:
+                        data = json_loads(f.read())
                         platform_posts += data.get('total_posts', 0)
                 except:
                     pass
@@ -5,6 +5,7 @@ Simple Historical Analysis App
 
 import streamlit as st
 import streamlit.components.v1 as components
+import html
 import json
 import os
 import pandas as pd
@@ -12,8 +13,11 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 from collections import Counter, defaultdict
+from urllib.parse import urlsplit
 from typing import Dict, List, Any, Optional, Tuple
 
+from src.serialization import json_loads
+
 # 页面配置
 st.set_page_config(
     page_title="BuzzScope - New Keyword Test",
@@ -307,8 +311,8 @@ class SimpleHistoricalAnalyzer:
             return {"status": "no_data", "posts": []}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
             return data
         except Exception as e:
             st.error(f"Error loading {file_path}: {e}")
@@ -562,19 +566,24 @@ def display_top_posts(posts: List[Dict[str, Any]], platform: str):
     
     st.subheader(f"Top Posts - {platform.title()}")
     
+    # 所有帖子拼成一段 <details> HTML 一次输出，而不是每帖一个折叠组件
+    items = []
     for i, post in enumerate(posts[:10]):
-        with st.expander(f"#{i+1} {post['title'][:50]}..."):
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.write(f"**Title:** {post['title']}")
-                st.write(f"**Author:** {post['author']}")
-                st.write(f"**Date:** {post['created_at']}")
-            
-            with col2:
-                st.write(f"**Interactions:** {post['interactions']}")
-                if post.get('url'):
-                    st.markdown(f"[View Post]({post['url']})")
+        link = ''
+        url = post.get('url')
+        # 链接来自抓取的数据（如用户提交的Reddit链接），只输出http(s)链接，避免javascript:等协议
+        if url and urlsplit(str(url)).scheme.lower() in ('http', 'https'):
+            link = f"<br><a href=\"{html.escape(str(url))}\" target=\"_blank\">View Post</a>"
+        
+        items.append(
+            f"<details><summary>#{i+1} {html.escape(post['title'][:50])}...</summary>"
+            f"<p><b>Title:</b> {html.escape(post['title'])}<br>"
+            f"<b>Author:</b> {html.escape(str(post['author']))}<br>"
+            f"<b>Date:</b> {html.escape(str(post['created_at']))}<br>"
+            f"<b>Interactions:</b> {post['interactions']}{link}</p></details>"
+        )
+    
+    st.markdown("\n".join(items), unsafe_allow_html=True)
 
 def load_cached_chart(platform: str, keyword: str) -> Dict[str, Any]:
     """加载缓存的图表数据"""
@@ -587,8 +596,8 @@ def load_cached_chart(platform: str, keyword: str) -> Dict[str, Any]:
     for chart_file in chart_files:
         if os.path.exists(chart_file):
             try:
-                with open(chart_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(chart_file, 'rb') as f:
+                    return json_loads(f.read())
             except Exception as e:
                 print(f"Error loading chart {chart_file}: {e}")
     
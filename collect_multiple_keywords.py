@@ -37,41 +37,38 @@ def main():
     # Initialize service
     service = DataCollectionServiceV2()
     
-    # Collect data for each keyword
-    all_results = {}
+    # Collect data for all keywords (historical archives are scanned once for all of them)
     start_time = time.time()
+    print(f"\n🔄 Collecting data for {len(args.keywords)} keywords...")
+    
+    try:
+        all_results = service.collect_keywords_data(
+            keywords=args.keywords,
+            exact_match=args.exact_match,
+            force_refresh=args.force_refresh,
+            delay=args.delay
+        )
+    except Exception as e:
+        print(f"  ❌ Error collecting data: {e}")
+        all_results = {keyword: {'error': str(e)} for keyword in args.keywords}
     
     for i, keyword in enumerate(args.keywords, 1):
-        print(f"\n🔄 [{i}/{len(args.keywords)}] Collecting data for '{keyword}'...")
+        results = all_results[keyword]
+        if 'error' in results:
+            continue
         
-        try:
-            results = service.collect_keyword_data(
-                keyword=keyword,
-                exact_match=args.exact_match,
-                force_refresh=args.force_refresh
-            )
-            all_results[keyword] = results
-            
-            # Show quick summary
-            total_posts = sum(
-                data.get('total_posts', 0) 
-                for data in results['platforms'].values() 
-                if data['status'] != 'error'
-            )
-            successful_platforms = sum(
-                1 for data in results['platforms'].values() 
-                if data['status'] != 'error'
-            )
-            
-            print(f"  ✅ {total_posts} posts from {successful_platforms} platforms")
-            
-        except Exception as e:
-            print(f"  ❌ Error collecting data for '{keyword}': {e}")
-            all_results[keyword] = {'error': str(e)}
+        # Show quick summary
+        total_posts = sum(
+            data.get('total_posts', 0)
+            for data in results['platforms'].values()
+            if data['status'] != 'error'
+        )
+        successful_platforms = sum(
+            1 for data in results['platforms'].values()
+            if data['status'] != 'error'
+        )
         
-        # Delay between collections (except for last one)
-        if i < len(args.keywords):
-            time.sleep(args.delay)
+        print(f"  ✅ [{i}/{len(args.keywords)}] '{keyword}': {total_posts} posts from {successful_platforms} platforms")
     
     # Calculate total time
     total_time = time.time() - start_time
@@ -10,6 +10,8 @@ from datetime import datetime
 from collections import defaultdict
 import plotly.graph_objects as go
 
+from src.serialization import json_loads
+
 def calculate_monthly_mentions(posts):
     """计算每月提及数"""
     monthly_counts = defaultdict(int)
@@ -58,8 +60,8 @@ def generate_chart_for_keyword(keyword):
             continue
         
         try:
-            with open(data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(data_file, 'rb') as f:
+                data = json_loads(f.read())
             
             posts = data.get('posts', [])
             if not posts:
@@ -48,7 +48,11 @@ def main():
     if args.once:
         # Run once
         print("\\n🔄 Running single check...")
-        notifications = service.monitor_keywords(args.keywords, args.exact_match)
+        try:
+            notifications = service.monitor_keywords(args.keywords, args.exact_match)
+        finally:
+            # Deliver queued MQTT notifications before the process exits
+            service.close()
         
         if notifications:
             print(f"\\n📢 Found {len(notifications)} mentions!")
@@ -12,6 +12,8 @@ from datetime import datetime
 from collections import defaultdict
 from typing import Dict, List, Any
 
+from src.serialization import json_loads
+
 def load_platform_data(platform: str, keyword: str, cache_dir: str = "data/cache") -> Dict[str, Any]:
     """加载平台数据"""
     file_path = os.path.join(cache_dir, platform, f"{keyword}.json")
@@ -19,8 +21,8 @@ def load_platform_data(platform: str, keyword: str, cache_dir: str = "data/cache
         return {"posts": []}
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = json_loads(f.read())
         return data
     except Exception as e:
         print(f"Error loading {file_path}: {e}")
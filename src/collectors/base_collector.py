@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import logging
+from ..keyword_matcher import word_check
 from ..models import BasePost
 
 logger = logging.getLogger(__name__)
@@ -60,21 +61,19 @@ class BaseCollector(ABC):
             exact_match: If True, use exact phrase matching. If False, use substring matching.
         """
         keyword_lower = keyword.lower()
-        mentions = []
         
+        if exact_match:
+            # Exact phrase matching - keyword must appear as complete phrase
+            matches = word_check(keyword_lower)
+        else:
+            # Substring matching - keyword can be part of a word
+            matches = lambda text_lower: keyword_lower in text_lower
+        
+        mentions = []
         for post in posts:
-            title_lower = post.title.lower()
-            content_lower = post.content.lower()
-            
-            if exact_match:
-                # Exact phrase matching - keyword must appear as complete phrase
-                if (self._exact_phrase_match(title_lower, keyword_lower) or 
-                    self._exact_phrase_match(content_lower, keyword_lower)):
-                    mentions.append(post)
-            else:
-                # Substring matching - keyword can be part of a word
-                if (keyword_lower in title_lower or keyword_lower in content_lower):
-                    mentions.append(post)
+            # Content (usually the long field) is only lowercased when the title doesn't match
+            if matches(post.title.lower()) or matches(post.content.lower()):
+                mentions.append(post)
         
         return mentions
     
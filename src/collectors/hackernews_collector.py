@@ -3,6 +3,7 @@ Hacker News data collector
 """
 import requests
 import time
+from dataclasses import replace
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 from .base_collector import BaseCollector
@@ -12,6 +13,9 @@ from ..config import Config
 class HackerNewsCollector(BaseCollector):
     """Collector for Hacker News data"""
     
+    # Seconds a fetched story set is reused by later keyword searches
+    STORY_CACHE_TTL = 300
+    
     def __init__(self):
         super().__init__("hackernews")
         self.api_url = Config.get_platform_config('hackernews')['api_url']
@@ -19,11 +23,41 @@ class HackerNewsCollector(BaseCollector):
         self.session.headers.update({
             'User-Agent': 'BuzzScope/1.0 (Keyword Tracking Tool)'
         })
+        
+        # Last fetched story set and when it was fetched (time.monotonic)
+        self._stories = None
+        self._stories_fetched_at = 0.0
     
     def search_keyword(self, keyword: str, days_back: int = 90, exact_match: bool = False) -> List[HackerNewsPost]:
         """Search Hacker News for keyword mentions"""
         self.logger.info(f"Searching Hacker News for keyword: {keyword} (exact_match={exact_match})")
         
+        # Stories to search (fetched once and shared by searches within the TTL)
+        unique_posts = self._collect_stories()
+        
+        # Filter by keyword and date
+        keyword_posts = self.extract_keyword_mentions(unique_posts, keyword, exact_match)
+        filtered_posts = self.filter_by_date_range(keyword_posts, days_back)
+        
+        self.logger.info(f"Found {len(filtered_posts)} posts mentioning '{keyword}' (exact_match={exact_match})")
+        
+        # 如果没有找到精确匹配的结果，尝试子字符串匹配
+        if len(filtered_posts) == 0 and exact_match:
+            self.logger.info(f"No exact matches found for '{keyword}', trying substring matching...")
+            keyword_posts_substring = self.extract_keyword_mentions(unique_posts, keyword, exact_match=False)
+            filtered_posts = self.filter_by_date_range(keyword_posts_substring, days_back)
+            self.logger.info(f"Found {len(filtered_posts)} posts with substring matching")
+        
+        # clean_posts edits posts in place; clean copies so the cached stories keep their raw text
+        return self.clean_posts([replace(post) for post in filtered_posts])
+    
+    def _collect_stories(self) -> List[HackerNewsPost]:
+        """Fetch the unique stories search_keyword filters, reusing a recent fetch"""
+        now = time.monotonic()
+        if self._stories is not None and now - self._stories_fetched_at < self.STORY_CACHE_TTL:
+            self.logger.info(f"Reusing {len(self._stories)} stories fetched from Hacker News")
+            return self._stories
+        
         # Get recent stories and comments
         all_posts = []
         
@@ -59,20 +93,9 @@ class HackerNewsCollector(BaseCollector):
         
         self.logger.info(f"Collected {len(unique_posts)} unique stories from Hacker News")
         
-        # Filter by keyword and date
-        keyword_posts = self.extract_keyword_mentions(unique_posts, keyword, exact_match)
-        filtered_posts = self.filter_by_date_range(keyword_posts, days_back)
-        
-        self.logger.info(f"Found {len(filtered_posts)} posts mentioning '{keyword}' (exact_match={exact_match})")
-        
-        # 如果没有找到精确匹配的结果，尝试子字符串匹配
-        if len(filtered_posts) == 0 and exact_match:
-            self.logger.info(f"No exact matches found for '{keyword}', trying substring matching...")
-            keyword_posts_substring = self.extract_keyword_mentions(unique_posts, keyword, exact_match=False)
-            filtered_posts = self.filter_by_date_range(keyword_posts_substring, days_back)
-            self.logger.info(f"Found {len(filtered_posts)} posts with substring matching")
-        
-        return self.clean_posts(filtered_posts)
+        self._stories = unique_posts
+        self._stories_fetched_at = now
+        return unique_posts
     
     def get_recent_posts(self, limit: int = 100) -> List[HackerNewsPost]:
         """Get recent posts from Hacker News"""
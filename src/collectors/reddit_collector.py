@@ -3,7 +3,7 @@ Reddit data collector using Reddit's public JSON API
 """
 import requests
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from .base_collector import BaseCollector
 from ..models import RedditPost
@@ -18,6 +18,10 @@ class RedditCollector(BaseCollector):
         # Reddit's public JSON API endpoints
         self.reddit_base_url = "https://www.reddit.com"
         self.reddit_json_url = "https://www.reddit.com/r"
+        
+        # Reuse one HTTP session so consecutive requests share a keep-alive connection
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'BuzzScope/1.0 (Educational Research Tool)'
 
         # Get subreddits to search
         self.subreddits = Config.get_platform_config('reddit').get('subreddits', [
@@ -27,8 +31,14 @@ class RedditCollector(BaseCollector):
 
         self.logger.info(f"Reddit collector initialized with Reddit's public JSON API")
 
-    def search_keyword(self, keyword: str, days_back: int = 30, exact_match: bool = False, use_global: bool = True) -> List[RedditPost]:
-        """Search Reddit for keyword mentions using Reddit's public JSON API"""
+    def search_keyword(self, keyword: str, days_back: int = 30, exact_match: bool = False, use_global: bool = True,
+                       limit: Optional[int] = None) -> List[RedditPost]:
+        """
+        Search Reddit for keyword mentions using Reddit's public JSON API
+        
+        If limit is given, stop querying further subreddits once that many
+        posts have been found and return at most limit posts.
+        """
         self.logger.info(f"Searching Reddit for keyword: {keyword} (exact_match={exact_match}, global={use_global})")
 
         posts = []
@@ -40,16 +50,15 @@ class RedditCollector(BaseCollector):
         
         # Search across configured subreddits
         for subreddit_name in self.subreddits:
+            if limit and len(posts) >= limit:
+                break
+            
             try:
                 # Get recent posts from subreddit
                 url = f"{self.reddit_json_url}/{subreddit_name}/new.json"
                 params = {'limit': 100}
 
-                headers = {
-                    'User-Agent': 'BuzzScope/1.0 (Educational Research Tool)'
-                }
-
-                response = requests.get(url, params=params, headers=headers, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
                 response.raise_for_status()
 
                 data = response.json()
@@ -71,7 +80,8 @@ class RedditCollector(BaseCollector):
                 continue
 
         self.logger.info(f"Found {len(posts)} Reddit posts mentioning '{keyword}'")
-        return self.clean_posts(posts)
+        posts = self.clean_posts(posts)
+        return posts[:limit] if limit else posts
     
     def _search_global(self, keyword: str, cutoff_date: datetime, exact_match: bool = False) -> List[RedditPost]:
         """Search Reddit globally for keyword mentions using search API"""
@@ -87,11 +97,7 @@ class RedditCollector(BaseCollector):
                 'limit': 100
             }
             
-            headers = {
-                'User-Agent': 'BuzzScope/1.0 (Educational Research Tool)'
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -124,11 +130,7 @@ class RedditCollector(BaseCollector):
             url = f"{self.reddit_base_url}/r/all/new.json"
             params = {'limit': limit}
 
-            headers = {
-                'User-Agent': 'BuzzScope/1.0 (Educational Research Tool)'
-            }
-
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -2,7 +2,7 @@
 YouTube data collector using YouTube Data API v3
 """
 from googleapiclient.discovery import build
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from .base_collector import BaseCollector
 from ..models import YouTubePost
@@ -22,8 +22,9 @@ class YouTubeCollector(BaseCollector):
             self.youtube = None
             self.logger.warning("YouTube API not configured. Set YOUTUBE_API_KEY in .env")
     
-    def search_keyword(self, keyword: str, days_back: int = 30, exact_match: bool = False) -> List[YouTubePost]:
-        """Search YouTube for keyword mentions"""
+    def search_keyword(self, keyword: str, days_back: int = 30, exact_match: bool = False,
+                       limit: Optional[int] = None) -> List[YouTubePost]:
+        """Search YouTube for keyword mentions, requesting at most limit results if given"""
         if not Config.is_platform_enabled('youtube'):
             self.logger.warning("YouTube API not configured")
             return []
@@ -41,7 +42,7 @@ class YouTubeCollector(BaseCollector):
                 type='video',
                 order='relevance',
                 publishedAfter=cutoff_date.isoformat() + 'Z',
-                maxResults=self.max_results
+                maxResults=min(self.max_results, limit) if limit else self.max_results
             ).execute()
             
             # Get video details for each result
@@ -3,6 +3,7 @@ Keyword management system for BuzzScope
 """
 import json
 import os
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date
 from dataclasses import dataclass, asdict
@@ -178,10 +179,9 @@ class KeywordManager:
         total_keywords = len(self.keywords)
         enabled_keywords = len(self.get_enabled_keywords())
         
-        platform_counts = {}
-        for config in self.keywords.values():
-            for platform in config.platforms:
-                platform_counts[platform] = platform_counts.get(platform, 0) + 1
+        platform_counts = dict(Counter(
+            platform for config in self.keywords.values() for platform in config.platforms
+        ))
         
         due_for_analysis = len(self.get_keywords_due_for_analysis())
         
@@ -0,0 +1,185 @@
+"""
+Multi-keyword text matching for BuzzScope
+Scans text for a set of keywords in a single pass
+"""
+import re
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Optional import - Aho-Corasick automaton for single-pass multi-keyword scans
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Characters that JSON encoders may escape, so they can't be found in raw bytes
+_JSON_ESCAPED = frozenset('"\\/')
+
+# Bytes lowercased at a time when probing raw data for keywords
+_PROBE_CHUNK = 1 << 20
+
+@lru_cache(maxsize=1024)
+def compile_word_pattern(keyword_lower: str) -> re.Pattern:
+    """Compile (once) the whole-word pattern for a lowercased keyword"""
+    return re.compile(r'\b' + re.escape(keyword_lower) + r'\b')
+
+def _is_word_char(char: str) -> bool:
+    """Same definition of a word character as the ``\\w`` regex class"""
+    return char.isalnum() or char == '_'
+
+def at_word_boundary(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is delimited the way ``\\b...\\b`` requires"""
+    before = _is_word_char(text[start - 1]) if start > 0 else False
+    if before == _is_word_char(text[start]):
+        return False
+    after = _is_word_char(text[end]) if end < len(text) else False
+    return _is_word_char(text[end - 1]) != after
+
+def contains_word(text_lower: str, keyword_lower: str) -> bool:
+    """
+    Whole-word search with the same result as ``compile_word_pattern(keyword_lower).search``
+    
+    Finds each occurrence with str.find and checks its boundaries, instead of
+    running the regex engine at every position of the text.
+    """
+    end_offset = len(keyword_lower)
+    start = text_lower.find(keyword_lower)
+    while start >= 0:
+        if at_word_boundary(text_lower, start, start + end_offset):
+            return True
+        start = text_lower.find(keyword_lower, start + 1)
+    return False
+
+def word_check(keyword_lower: str) -> Callable[[str], bool]:
+    """Build a whole-word test for lowercased text"""
+    return partial(contains_word, keyword_lower=keyword_lower)
+
+class KeywordMatcher:
+    """
+    Match a fixed set of keywords against text
+    
+    Built once per collection call. With ``pyahocorasick`` installed and more
+    than one keyword, every text is scanned once regardless of the number of
+    keywords; otherwise each keyword uses its precompiled pattern.
+    """
+    
+    def __init__(self, keywords: Iterable[str], exact_match: bool = True):
+        """
+        Args:
+            keywords: Keywords to look for
+            exact_match: If True, keywords must appear as whole words/phrases.
+                If False, use substring matching.
+        """
+        self.keywords = list(dict.fromkeys(kw for kw in keywords if kw))
+        self.exact_match = exact_match
+        
+        # Lowercased keyword -> original spellings that map to it
+        self._by_lower: Dict[str, List[str]] = {}
+        for keyword in self.keywords:
+            self._by_lower.setdefault(keyword.lower(), []).append(keyword)
+        
+        # Byte needles for probing raw files before parsing them. Keywords that
+        # JSON may escape (non-ASCII, control chars, quotes, slashes) can't be probed reliably.
+        self._needles: Optional[List[bytes]] = []
+        for keyword_lower in self._by_lower:
+            if keyword_lower.isascii() and keyword_lower.isprintable() and not set(keyword_lower) & _JSON_ESCAPED:
+                self._needles.append(keyword_lower.encode('ascii'))
+            else:
+                self._needles = None
+                break
+        
+        self._automaton = None
+        self._checks: List[Tuple[List[str], Callable[[str], bool]]] = []
+        
+        if ahocorasick is not None and len(self._by_lower) > 1:
+            automaton = ahocorasick.Automaton()
+            for keyword_lower, originals in self._by_lower.items():
+                automaton.add_word(keyword_lower, (len(keyword_lower), tuple(originals)))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            for keyword_lower, originals in self._by_lower.items():
+                if exact_match:
+                    check = word_check(keyword_lower)
+                else:
+                    check = self._substring_check(keyword_lower)
+                self._checks.append((originals, check))
+    
+    @staticmethod
+    def _substring_check(keyword_lower: str) -> Callable[[str], bool]:
+        """Build a substring test for a lowercased keyword"""
+        return lambda text_lower: keyword_lower in text_lower
+    
+    def find(self, text: str) -> Set[str]:
+        """Return the keywords mentioned in text"""
+        if not text:
+            return set()
+        
+        text_lower = text.lower()
+        
+        if self._automaton is not None:
+            found = set()
+            for end, (size, originals) in self._automaton.iter(text_lower):
+                start = end - size + 1
+                if self.exact_match and not at_word_boundary(text_lower, start, end + 1):
+                    continue
+                found.update(originals)
+            return found
+        
+        found = set()
+        for originals, check in self._checks:
+            if check(text_lower):
+                found.update(originals)
+        return found
+    
+    def may_occur_in(self, raw) -> bool:
+        """
+        Cheap pre-check on raw (e.g. JSON) bytes before parsing them
+        
+        raw may be bytes or any sliceable buffer such as an mmap; it is
+        lowercased chunk by chunk, never as a whole copy. Returns False only
+        when no keyword can possibly match, so callers may skip decoding
+        the data entirely.
+        """
+        if self._needles is None:
+            return True
+        
+        if isinstance(raw, bytes) and len(raw) <= _PROBE_CHUNK:
+            raw_lower = raw.lower()
+            return any(needle in raw_lower for needle in self._needles)
+        return self._scan_chunks(raw[i:i + _PROBE_CHUNK] for i in range(0, len(raw), _PROBE_CHUNK))
+    
+    def may_occur_in_file(self, file_path, chunk_size: int = _PROBE_CHUNK) -> bool:
+        """Same check as may_occur_in, reading the file in chunks to bound memory"""
+        if self._needles is None:
+            return True
+        
+        with open(file_path, 'rb') as f:
+            return self._scan_chunks(iter(partial(f.read, chunk_size), b''))
+    
+    def _scan_chunks(self, chunks: Iterable[bytes]) -> bool:
+        """Look for any needle in consecutive chunks of raw bytes"""
+        if not self._needles:
+            return False
+        
+        # Carry the end of each chunk over so needles split across chunks are found
+        overlap = max(len(needle) for needle in self._needles) - 1
+        tail = b''
+        
+        for chunk in chunks:
+            window = tail + chunk.lower()
+            if any(needle in window for needle in self._needles):
+                return True
+            tail = window[-overlap:] if overlap else b''
+        return False
+    
+    def matches(self, text: str) -> bool:
+        """Check if text mentions any of the keywords"""
+        if not text:
+            return False
+        
+        if self._automaton is not None:
+            return bool(self.find(text))
+        
+        text_lower = text.lower()
+        return any(check(text_lower) for _, check in self._checks)
@@ -0,0 +1,98 @@
+"""
+JSON serialization helpers for BuzzScope
+Uses orjson when available and falls back to the standard library
+"""
+import os
+import json
+import mmap
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+# Optional import - orjson is a much faster JSON codec
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # Let datetimes/dataclasses go through default=str like json.dump did,
+    # and accept non-string dict keys the way the stdlib encoder does
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes
+
+    Args:
+        data: Data to serialize (unsupported types are converted with str())
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        options = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(data, default=str, option=options)
+
+    if indent:
+        return json.dumps(data, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), default=str, ensure_ascii=False).encode('utf-8')
+
+def json_loads(raw: Union[bytes, str, mmap.mmap]) -> Any:
+    """Deserialize a JSON document from bytes, str or a mapped file"""
+    if isinstance(raw, mmap.mmap):
+        if orjson is not None:
+            # Parse straight from the mapping without copying it
+            with memoryview(raw) as view:
+                return orjson.loads(view)
+        raw = raw[:]
+    
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+@contextmanager
+def mapped_file(path: Union[str, Path]) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Map a file read-only so it can be scanned and parsed without reading it into memory
+    
+    Empty files can't be mapped and yield b'' instead.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+# Process umask, so atomically written files get the usual permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes):
+    """
+    Write a file so readers only ever see the old or the complete new content
+
+    The data goes to a temporary file in the same directory in a single
+    write and is then renamed over the target.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -3,18 +3,198 @@ Data Collection Service V2
 Handles both historical and real-time data collection with caching
 """
 import os
-import json
+import re
+import csv
+import multiprocessing
+import time
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from typing import Dict, List, Any, Callable, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from ..collectors import HackerNewsCollector, RedditCollector, YouTubeCollector, DiscordIncrementalCollector
 from ..config import Config
+from ..keyword_matcher import KeywordMatcher
+from ..serialization import atomic_write_bytes, json_dumps, json_loads, mapped_file
+
+# Worker processes for scanning historical archives (JSON/CSV parsing is CPU-bound)
+SCAN_WORKERS = os.cpu_count() or 1
+# Scans run while other threads (collectors, thread pools) may hold locks, so
+# worker processes must not be forked from this process
+SCAN_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Each worker spends most of a second importing this module, so smaller
+# batches are scanned in-process and the pool is kept for later scans
+PROCESS_SCAN_MIN_BYTES = 128 * 1024 * 1024
+_scan_executor: Optional[ProcessPoolExecutor] = None
+_scan_executor_lock = threading.Lock()
+
+# Parsed cache files kept in memory: path -> ((mtime_ns, size), payload)
+MEM_CACHE_SIZE = 256
+_mem_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+_mem_cache_lock = threading.Lock()
+
+# collect_keyword_data calls shared across service instances:
+# (cache_dir, keyword, exact_match) -> running Future / (expiry, results)
+RESULT_TTL_SECONDS = 60
+_inflight_collections: Dict[Tuple[str, str, bool], Future] = {}
+_recent_collections: Dict[Tuple[str, str, bool], Tuple[float, Dict[str, Any]]] = {}
+_collections_lock = threading.Lock()
+
+# Characters not allowed in cache file names
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-_]')
+
+@lru_cache(maxsize=1024)
+def _sanitize_keyword(keyword: str) -> str:
+    """Sanitize keyword for filename"""
+    # Replace spaces and special characters with underscores
+    return _UNSAFE_FILENAME_CHARS.sub('_', keyword.lower())
+
+@lru_cache(maxsize=32)
+def _get_matcher(keywords: Tuple[str, ...], exact_match: bool) -> KeywordMatcher:
+    """Build a keyword matcher once per worker process"""
+    return KeywordMatcher(keywords, exact_match)
+
+def _prefetch_files(file_paths: List[Path]):
+    """
+    Ask the kernel to start reading a batch of files ahead of the scan
+    
+    Issues POSIX_FADV_WILLNEED for every file up front so readahead for the
+    whole batch is queued on the device at once instead of one file at a time.
+    No-op on platforms without posix_fadvise.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    for file_path in file_paths:
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+def _copy_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a shared cache payload down to its posts so callers can edit it freely"""
+    payload = dict(data)
+    posts = payload.get('posts')
+    if isinstance(posts, list):
+        payload['posts'] = [dict(post) if isinstance(post, dict) else post for post in posts]
+    return payload
+
+def _copy_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy shared collection results down to each platform's posts"""
+    copied = dict(results)
+    if isinstance(results.get('platforms'), dict):
+        copied['platforms'] = {
+            platform: _copy_payload(data) if isinstance(data, dict) else data
+            for platform, data in results['platforms'].items()
+        }
+    return copied
+
+def _total_size(file_paths: List[Path]) -> int:
+    """Total size in bytes of the files that exist"""
+    total = 0
+    for file_path in file_paths:
+        try:
+            total += os.stat(file_path).st_size
+        except OSError:
+            pass
+    return total
+
+def _get_scan_executor() -> ProcessPoolExecutor:
+    """Worker pool shared by all scans, started on first use"""
+    global _scan_executor
+    with _scan_executor_lock:
+        if _scan_executor is None:
+            _scan_executor = ProcessPoolExecutor(max_workers=SCAN_WORKERS, mp_context=SCAN_CONTEXT)
+        return _scan_executor
+
+def _discard_scan_executor(executor: ProcessPoolExecutor):
+    """Drop a broken worker pool so the next scan starts a fresh one"""
+    global _scan_executor
+    with _scan_executor_lock:
+        if _scan_executor is executor:
+            _scan_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def _filter_posts_by_keywords(posts: List[Dict], matcher: KeywordMatcher) -> Dict[str, List[Dict]]:
+    """Filter posts by several keywords, scanning each post once"""
+    filtered = {keyword: [] for keyword in matcher.keywords}
+    
+    total = len(filtered)
+    
+    for post in posts:
+        # Check title and content separately rather than concatenating them;
+        # content is only scanned if the title didn't already match every keyword
+        found = matcher.find(post.get('title', ''))
+        if len(found) < total:
+            found |= matcher.find(post.get('content', ''))
+        
+        for keyword in found:
+            filtered[keyword].append(post)
+    
+    return filtered
+
+def _scan_hn_file(file_path: Path, keywords: Tuple[str, ...], exact_match: bool) -> Dict[str, List[Dict]]:
+    """Scan one Hacker News historical file (module level so it can run in a worker process)"""
+    matcher = _get_matcher(keywords, exact_match)
+    
+    with mapped_file(file_path) as raw:
+        # Skip parsing files that can't mention any keyword
+        if not matcher.may_occur_in(raw):
+            return {}
+        
+        data = json_loads(raw)
+    return _filter_posts_by_keywords(data.get('posts', []), matcher)
+
+def _scan_discord_file(file_path: Path, community: str, keywords: Tuple[str, ...],
+                       exact_match: bool) -> Dict[str, List[Dict]]:
+    """Scan one Discord CSV export (module level so it can run in a worker process)"""
+    matcher = _get_matcher(keywords, exact_match)
+    posts = {keyword: [] for keyword in matcher.keywords}
+    
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        # Stream rows; csv handles commas and newlines inside quoted content
+        reader = csv.DictReader(f)
+        
+        for row in reader:
+            content = row.get('Content') or ''
+            
+            for keyword in matcher.find(content):
+                post = {
+                    'content': content,
+                    'author': row.get('Author') or 'Unknown',
+                    'timestamp': row.get('Date') or '',
+                    'community': community,
+                    'platform': 'discord'
+                }
+                posts[keyword].append(post)
+    
+    return posts
 
 class DataCollectionServiceV2:
     """Enhanced data collection service with caching and historical data support"""
     
+    PLATFORMS = ['hackernews', 'reddit', 'youtube', 'discord']
+    
+    # Platforms collected live from their APIs (time=all search)
+    API_PLATFORMS = ['reddit', 'youtube']
+    
+    # Most relevant results kept per API platform
+    TIME_ALL_LIMIT = 100
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         
@@ -24,7 +204,7 @@ class DataCollectionServiceV2:
         self.cache_dir = self.data_dir / 'cache'
         
         # Ensure directories exist
-        for platform in ['hackernews', 'reddit', 'youtube', 'discord']:
+        for platform in self.PLATFORMS:
             (self.historical_dir / platform).mkdir(parents=True, exist_ok=True)
             (self.cache_dir / platform).mkdir(parents=True, exist_ok=True)
         
@@ -36,6 +216,12 @@ class DataCollectionServiceV2:
             'discord': DiscordIncrementalCollector()
         }
         
+        # Sanitized keywords with a cache file, per platform (kept in sync by save/clear)
+        self._cached_index: Dict[str, Set[str]] = {
+            platform: {name[:-5] for name in self._list_cache_files(platform)}
+            for platform in self.PLATFORMS
+        }
+        
         self.logger.info("DataCollectionServiceV2 initialized")
     
     def collect_keyword_data(self, keyword: str, exact_match: bool = True, 
@@ -51,6 +237,97 @@ class DataCollectionServiceV2:
         Returns:
             Dictionary with collection results for each platform
         """
+        # Concurrent or repeated calls for the same keyword share one collection
+        key = (str(self.cache_dir), keyword, exact_match)
+        
+        with _collections_lock:
+            recent = _recent_collections.get(key)
+            if not force_refresh and recent and recent[0] > time.monotonic():
+                return _copy_results(recent[1])
+            
+            future = None if force_refresh else _inflight_collections.get(key)
+            if future is None:
+                owner = True
+                future = Future()
+                if not force_refresh:
+                    _inflight_collections[key] = future
+            else:
+                owner = False
+        
+        if not owner:
+            self.logger.info(f"Waiting for in-progress collection of '{keyword}'")
+            return _copy_results(future.result())
+        
+        try:
+            results = self._collect_keyword_data(keyword, exact_match, force_refresh, {})
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _collections_lock:
+                if _inflight_collections.get(key) is future:
+                    del _inflight_collections[key]
+        
+        with _collections_lock:
+            now = time.monotonic()
+            for stale in [k for k, (expiry, _) in _recent_collections.items() if expiry <= now]:
+                del _recent_collections[stale]
+            _recent_collections[key] = (now + RESULT_TTL_SECONDS, results)
+        
+        future.set_result(results)
+        return _copy_results(results)
+    
+    def collect_keywords_data(self, keywords: List[str], exact_match: bool = True,
+                              force_refresh: bool = False, delay: float = 0) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect data for several keywords, scanning historical sources once
+        
+        Args:
+            keywords: Keywords to collect data for
+            exact_match: Whether to use exact phrase matching
+            force_refresh: Force refresh even if cached data exists
+            delay: Seconds to wait between keywords (rate limiting for the live APIs)
+            
+        Returns:
+            Dictionary mapping each keyword to its collection results
+        """
+        historical_posts = {}
+        
+        # One pass over the HN / Discord archives for every keyword that needs it
+        for platform in ['hackernews', 'discord']:
+            pending = [
+                keyword for keyword in keywords
+                if force_refresh or not self._get_cache_file(platform, keyword).exists()
+            ]
+            if not pending:
+                continue
+            
+            try:
+                historical_posts[platform] = self._collect_historical_keywords(
+                    platform, pending, exact_match
+                )
+            except Exception as e:
+                self.logger.error(f"Error scanning {platform} historical data: {e}")
+        
+        all_results = {}
+        for i, keyword in enumerate(keywords):
+            if i and delay:
+                time.sleep(delay)
+            
+            prefetched = {
+                platform: posts_by_keyword[keyword]
+                for platform, posts_by_keyword in historical_posts.items()
+                if keyword in posts_by_keyword
+            }
+            all_results[keyword] = self._collect_keyword_data(
+                keyword, exact_match, force_refresh, prefetched
+            )
+        
+        return all_results
+    
+    def _collect_keyword_data(self, keyword: str, exact_match: bool, force_refresh: bool,
+                              prefetched: Dict[str, List]) -> Dict[str, Any]:
+        """Collect data for a keyword, reusing posts already scanned per platform"""
         self.logger.info(f"Collecting data for keyword: '{keyword}' (exact_match={exact_match})")
         
         results = {
@@ -60,20 +337,34 @@ class DataCollectionServiceV2:
             'platforms': {}
         }
         
-        # Collect from each platform
-        for platform in ['hackernews', 'reddit', 'youtube', 'discord']:
-            try:
-                platform_result = self._collect_platform_data(
-                    platform, keyword, exact_match, force_refresh
+        # Reddit and YouTube are network-bound, so query them in the background
+        # while the local HN / Discord archives are processed
+        with ThreadPoolExecutor(max_workers=len(self.API_PLATFORMS)) as executor:
+            futures = {
+                platform: executor.submit(
+                    self._collect_platform_data, platform, keyword, exact_match, force_refresh
                 )
-                results['platforms'][platform] = platform_result
-            except Exception as e:
-                self.logger.error(f"Error collecting {platform} data: {e}")
-                results['platforms'][platform] = {
-                    'status': 'error',
-                    'error': str(e),
-                    'posts': []
-                }
+                for platform in self.API_PLATFORMS
+            }
+            
+            # Collect from each platform
+            for platform in self.PLATFORMS:
+                try:
+                    if platform in futures:
+                        platform_result = futures[platform].result()
+                    else:
+                        platform_result = self._collect_platform_data(
+                            platform, keyword, exact_match, force_refresh,
+                            posts=prefetched.get(platform)
+                        )
+                    results['platforms'][platform] = platform_result
+                except Exception as e:
+                    self.logger.error(f"Error collecting {platform} data: {e}")
+                    results['platforms'][platform] = {
+                        'status': 'error',
+                        'error': str(e),
+                        'posts': []
+                    }
         
         # Save collection summary
         self._save_collection_summary(results)
@@ -81,19 +372,23 @@ class DataCollectionServiceV2:
         return results
     
     def _collect_platform_data(self, platform: str, keyword: str, 
-                              exact_match: bool, force_refresh: bool) -> Dict[str, Any]:
+                              exact_match: bool, force_refresh: bool,
+                              posts: Optional[List] = None) -> Dict[str, Any]:
         """Collect data for a specific platform"""
         self.logger.info(f"Collecting {platform} data for '{keyword}'")
         
         # Check if cached data exists
-        cache_file = self.cache_dir / platform / f"{self._sanitize_keyword(keyword)}.json"
+        cache_file = self._get_cache_file(platform, keyword)
         
         if not force_refresh and cache_file.exists():
             self.logger.info(f"Using cached data for {platform}")
             return self._load_cached_data(cache_file)
         
         # Collect new data based on platform strategy
-        if platform in ['hackernews', 'discord']:
+        if posts is not None:
+            # Already scanned together with other keywords
+            pass
+        elif platform in ['hackernews', 'discord']:
             # Use historical data for HN and Discord
             posts = self._collect_historical_data(platform, keyword, exact_match)
         else:
@@ -117,14 +412,21 @@ class DataCollectionServiceV2:
     
     def _collect_historical_data(self, platform: str, keyword: str, exact_match: bool) -> List:
         """Collect data from historical sources (HN, Discord)"""
+        return self._collect_historical_keywords(platform, [keyword], exact_match).get(keyword, [])
+    
+    def _collect_historical_keywords(self, platform: str, keywords: List[str],
+                                     exact_match: bool) -> Dict[str, List]:
+        """Collect data for several keywords from historical sources in one pass"""
         self.logger.info(f"Collecting historical data from {platform}")
         
+        matcher = KeywordMatcher(keywords, exact_match)
+        
         if platform == 'hackernews':
-            return self._collect_hackernews_historical(keyword, exact_match)
+            return self._collect_hackernews_historical(matcher)
         elif platform == 'discord':
-            return self._collect_discord_historical(keyword, exact_match)
+            return self._collect_discord_historical(matcher)
         else:
-            return []
+            return {keyword: [] for keyword in matcher.keywords}
     
     def _collect_time_all_data(self, platform: str, keyword: str, exact_match: bool) -> List:
         """Collect data using time=all strategy (Reddit, YouTube)"""
@@ -138,135 +440,133 @@ class DataCollectionServiceV2:
                 keyword=keyword,
                 days_back=365*5,  # 5 years
                 exact_match=exact_match,
-                use_global=True
+                use_global=True,
+                limit=self.TIME_ALL_LIMIT
             )
             # Limit to top 100 most relevant
-            return posts[:100]
+            return posts[:self.TIME_ALL_LIMIT]
             
         elif platform == 'youtube':
             # YouTube: search with time=all (5 years)
             posts = collector.search_keyword(
                 keyword=keyword,
                 days_back=365*5,  # 5 years
-                exact_match=exact_match
+                exact_match=exact_match,
+                limit=self.TIME_ALL_LIMIT
             )
             # Limit to top 100 most relevant
-            return posts[:100]
+            return posts[:self.TIME_ALL_LIMIT]
         
         return []
     
-    def _collect_hackernews_historical(self, keyword: str, exact_match: bool) -> List:
+    def _collect_hackernews_historical(self, matcher: KeywordMatcher) -> Dict[str, List]:
         """Collect Hacker News data from historical files"""
         hn_dir = self.historical_dir / 'hackernews'
-        posts = []
         
         if not hn_dir.exists():
             self.logger.warning("No Hacker News historical data directory found")
-            return posts
+            return {keyword: [] for keyword in matcher.keywords}
         
         # Search through all JSON files
-        for file_path in hn_dir.glob('*.json'):
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    file_posts = data.get('posts', [])
-                    
-                    # Filter by keyword
-                    filtered_posts = self._filter_posts_by_keyword(file_posts, keyword, exact_match)
-                    posts.extend(filtered_posts)
-                    
-            except Exception as e:
-                self.logger.warning(f"Error reading {file_path}: {e}")
-                continue
+        jobs = [(file_path,) for file_path in hn_dir.glob('*.json')]
+        posts = self._scan_files(_scan_hn_file, jobs, matcher)
         
-        self.logger.info(f"Found {len(posts)} Hacker News posts for '{keyword}'")
+        for keyword, keyword_posts in posts.items():
+            self.logger.info(f"Found {len(keyword_posts)} Hacker News posts for '{keyword}'")
         return posts
     
-    def _collect_discord_historical(self, keyword: str, exact_match: bool) -> List:
+    def _collect_discord_historical(self, matcher: KeywordMatcher) -> Dict[str, List]:
         """Collect Discord data from historical files"""
         discord_dir = self.data_dir / 'discord'
-        posts = []
         
         if not discord_dir.exists():
             self.logger.warning("No Discord historical data directory found")
-            return posts
+            return {keyword: [] for keyword in matcher.keywords}
         
         # Search through all community directories
-        for community_dir in discord_dir.iterdir():
-            if community_dir.is_dir():
-                community_posts = self._search_discord_community(
-                    community_dir, keyword, exact_match
-                )
-                posts.extend(community_posts)
-        
-        self.logger.info(f"Found {len(posts)} Discord posts for '{keyword}'")
+        jobs = [
+            (file_path, community_dir.name)
+            for community_dir in discord_dir.iterdir() if community_dir.is_dir()
+            for file_path in community_dir.glob('*.csv')
+        ]
+        posts = self._scan_files(_scan_discord_file, jobs, matcher)
+        
+        for keyword, keyword_posts in posts.items():
+            self.logger.info(f"Found {len(keyword_posts)} Discord posts for '{keyword}'")
         return posts
     
-    def _search_discord_community(self, community_dir: Path, keyword: str, exact_match: bool) -> List:
-        """Search Discord community directory for keyword mentions"""
-        posts = []
+    def _scan_files(self, scan: Callable, jobs: List[Tuple], matcher: KeywordMatcher) -> Dict[str, List]:
+        """Run a per-file scan across worker processes and merge posts per keyword"""
+        posts = {keyword: [] for keyword in matcher.keywords}
+        keywords = tuple(matcher.keywords)
         
-        for file_path in community_dir.glob('*.csv'):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    
-                    # Skip header
-                    for line in lines[1:]:
-                        parts = line.strip().split(',')
-                        if len(parts) >= 4:
-                            content = parts[3]  # Content is usually in 4th column
-                            
-                            if self._contains_keyword(content, keyword, exact_match):
-                                post = {
-                                    'content': content,
-                                    'author': parts[1] if len(parts) > 1 else 'Unknown',
-                                    'timestamp': parts[0] if len(parts) > 0 else '',
-                                    'community': community_dir.name,
-                                    'platform': 'discord'
-                                }
-                                posts.append(post)
-                                
-            except Exception as e:
-                self.logger.warning(f"Error reading {file_path}: {e}")
-                continue
+        file_paths = [job[0] for job in jobs]
+        _prefetch_files(file_paths)
         
-        return posts
-    
-    def _filter_posts_by_keyword(self, posts: List[Dict], keyword: str, exact_match: bool) -> List[Dict]:
-        """Filter posts by keyword"""
-        filtered = []
-        keyword_lower = keyword.lower()
+        if len(jobs) <= 1 or _total_size(file_paths) < PROCESS_SCAN_MIN_BYTES:
+            # Not worth handing to worker processes
+            results = [self._run_scan(scan, job, keywords, matcher.exact_match) for job in jobs]
+        else:
+            results = self._run_scans_in_workers(scan, jobs, keywords, matcher.exact_match)
         
-        for post in posts:
-            title = post.get('title', '')
-            content = post.get('content', '')
-            
-            if self._contains_keyword(title + ' ' + content, keyword_lower, exact_match):
-                filtered.append(post)
+        # Merge in file order so results are deterministic
+        for file_posts in results:
+            for keyword, keyword_posts in file_posts.items():
+                posts[keyword].extend(keyword_posts)
         
-        return filtered
+        return posts
     
-    def _contains_keyword(self, text: str, keyword: str, exact_match: bool) -> bool:
-        """Check if text contains keyword"""
-        if not text or not keyword:
-            return False
+    def _run_scans_in_workers(self, scan: Callable, jobs: List[Tuple], keywords: Tuple[str, ...],
+                              exact_match: bool) -> List[Dict[str, List]]:
+        """Run file scans on the shared worker pool, rescanning in-process if the pool breaks"""
+        executor = _get_scan_executor()
+        futures = []
+        try:
+            for job in jobs:
+                futures.append(executor.submit(scan, *job, keywords, exact_match))
+        except BrokenProcessPool:
+            pass
+        
+        results = []
+        broken = len(futures) < len(jobs)
+        for i, job in enumerate(jobs):
+            if i < len(futures):
+                try:
+                    results.append(futures[i].result())
+                    continue
+                except BrokenProcessPool:
+                    broken = True
+                except Exception as e:
+                    self.logger.warning(f"Error reading {job[0]}: {e}")
+                    results.append({})
+                    continue
+            
+            # A worker died (crash, OOM kill, failed start): scan the file here
+            # rather than caching a result that silently misses it
+            results.append(self._run_scan(scan, job, keywords, exact_match))
         
-        text_lower = text.lower()
+        if broken:
+            self.logger.warning("Scan worker pool broke; remaining files were scanned in-process")
+            _discard_scan_executor(executor)
         
-        if exact_match:
-            import re
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            return bool(re.search(pattern, text_lower))
-        else:
-            return keyword in text_lower
+        return results
+    
+    def _run_scan(self, scan: Callable, job: Tuple, keywords: Tuple[str, ...],
+                  exact_match: bool) -> Dict[str, List]:
+        """Run a single file scan in-process"""
+        try:
+            return scan(*job, keywords, exact_match)
+        except Exception as e:
+            self.logger.warning(f"Error reading {job[0]}: {e}")
+            return {}
+    
+    def _get_cache_file(self, platform: str, keyword: str) -> Path:
+        """Get cache file path for a keyword on a platform"""
+        return self.cache_dir / platform / f"{self._sanitize_keyword(keyword)}.json"
     
     def _sanitize_keyword(self, keyword: str) -> str:
         """Sanitize keyword for filename"""
-        import re
-        # Replace spaces and special characters with underscores
-        sanitized = re.sub(r'[^\w\-_]', '_', keyword.lower())
-        return sanitized
+        return _sanitize_keyword(keyword)
     
     def _post_to_dict(self, post) -> Dict[str, Any]:
         """Convert post object to dictionary"""
@@ -280,10 +580,26 @@ class DataCollectionServiceV2:
     def _load_cached_data(self, cache_file: Path) -> Dict[str, Any]:
         """Load cached data from file"""
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-                data['status'] = 'cached'
-                return data
+            st = cache_file.stat()
+            version = (st.st_mtime_ns, st.st_size)
+            key = str(cache_file)
+            
+            with _mem_cache_lock:
+                hit = _mem_cache.get(key)
+                if hit is not None and hit[0] == version:
+                    _mem_cache.move_to_end(key)
+                    return _copy_payload(hit[1])
+            
+            data = json_loads(cache_file.read_bytes())
+            data['status'] = 'cached'
+            
+            with _mem_cache_lock:
+                _mem_cache[key] = (version, data)
+                _mem_cache.move_to_end(key)
+                while len(_mem_cache) > MEM_CACHE_SIZE:
+                    _mem_cache.popitem(last=False)
+            
+            return _copy_payload(data)
         except Exception as e:
             self.logger.error(f"Error loading cached data from {cache_file}: {e}")
             return {'status': 'error', 'error': str(e), 'posts': []}
@@ -291,8 +607,10 @@ class DataCollectionServiceV2:
     def _save_cached_data(self, cache_file: Path, data: Dict[str, Any]):
         """Save data to cache file"""
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            with _mem_cache_lock:
+                _mem_cache.pop(str(cache_file), None)
+            atomic_write_bytes(cache_file, json_dumps(data))
+            self._cached_index.setdefault(cache_file.parent.name, set()).add(cache_file.stem)
             self.logger.info(f"Cached data saved to {cache_file}")
         except Exception as e:
             self.logger.error(f"Error saving cached data to {cache_file}: {e}")
@@ -302,41 +620,46 @@ class DataCollectionServiceV2:
         summary_file = self.cache_dir / f"collection_summary_{self._sanitize_keyword(results['keyword'])}.json"
         
         try:
-            with open(summary_file, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            atomic_write_bytes(summary_file, json_dumps(results))
             self.logger.info(f"Collection summary saved to {summary_file}")
         except Exception as e:
             self.logger.error(f"Error saving collection summary: {e}")
     
+    def _list_cache_files(self, platform: str) -> List[str]:
+        """List cache file names for a platform without building Path objects"""
+        try:
+            with os.scandir(self.cache_dir / platform) as entries:
+                return [entry.name for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+        except FileNotFoundError:
+            return []
+    
     def get_cached_keywords(self) -> List[str]:
         """Get list of keywords with cached data"""
-        keywords = set()
-        
-        for platform_dir in self.cache_dir.iterdir():
-            if platform_dir.is_dir():
-                for cache_file in platform_dir.glob('*.json'):
-                    # Extract keyword from filename
-                    keyword = cache_file.stem
-                    keywords.add(keyword)
-        
-        return sorted(list(keywords))
+        return sorted(set().union(*self._cached_index.values()))
     
     def clear_cache(self, keyword: str = None):
         """Clear cache for specific keyword or all keywords"""
+        with _collections_lock:
+            for key in [k for k in _recent_collections if k[0] == str(self.cache_dir)]:
+                if keyword is None or self._sanitize_keyword(key[1]) == self._sanitize_keyword(keyword):
+                    del _recent_collections[key]
+        
         if keyword:
             sanitized = self._sanitize_keyword(keyword)
-            for platform_dir in self.cache_dir.iterdir():
-                if platform_dir.is_dir():
-                    cache_file = platform_dir / f"{sanitized}.json"
-                    if cache_file.exists():
-                        cache_file.unlink()
-                        self.logger.info(f"Cleared cache for '{keyword}' in {platform_dir.name}")
+            for platform in self.PLATFORMS:
+                try:
+                    os.unlink(self.cache_dir / platform / f"{sanitized}.json")
+                    self.logger.info(f"Cleared cache for '{keyword}' in {platform}")
+                except FileNotFoundError:
+                    pass
+                self._cached_index[platform].discard(sanitized)
         else:
             # Clear all cache
-            for platform_dir in self.cache_dir.iterdir():
-                if platform_dir.is_dir():
-                    for cache_file in platform_dir.glob('*.json'):
-                        cache_file.unlink()
+            for platform in self.PLATFORMS:
+                platform_dir = self.cache_dir / platform
+                for name in self._list_cache_files(platform):
+                    os.unlink(platform_dir / name)
+                self._cached_index[platform].clear()
             self.logger.info("Cleared all cache")
     
     def get_collection_stats(self) -> Dict[str, Any]:
@@ -346,18 +669,11 @@ class DataCollectionServiceV2:
             'platforms': {}
         }
         
-        for platform in ['hackernews', 'reddit', 'youtube', 'discord']:
-            platform_dir = self.cache_dir / platform
-            if platform_dir.exists():
-                cache_files = list(platform_dir.glob('*.json'))
-                stats['platforms'][platform] = {
-                    'cached_keywords': len(cache_files),
-                    'cache_files': [f.name for f in cache_files]
-                }
-            else:
-                stats['platforms'][platform] = {
-                    'cached_keywords': 0,
-                    'cache_files': []
-                }
+        for platform in self.PLATFORMS:
+            cache_files = [f"{keyword}.json" for keyword in sorted(self._cached_index[platform])]
+            stats['platforms'][platform] = {
+                'cached_keywords': len(cache_files),
+                'cache_files': cache_files
+            }
         
         return stats
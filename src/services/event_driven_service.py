@@ -4,6 +4,8 @@ Monitors daily hot posts for keyword mentions and sends notifications
 """
 import os
 import json
+import time
+import asyncio
 import smtplib
 import paho.mqtt.client as mqtt
 from email.mime.text import MIMEText
@@ -12,6 +14,7 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from ..collectors import HackerNewsCollector, RedditCollector, YouTubeCollector
 from ..config import Config
+from ..serialization import json_dumps
 from .realtime_collection_service import RealtimeCollectionService
 
 class EventDrivenService:
@@ -27,6 +30,9 @@ class EventDrivenService:
         self.mqtt_use_tls = mqtt_use_tls or os.getenv('MQTT_USE_TLS', 'false').lower() == 'true'
         self.mqtt_client = None
         
+        # QoS 1 publishes that may not be acknowledged yet (flushed by close())
+        self._pending_publishes: List[mqtt.MQTTMessageInfo] = []
+        
         # Email configuration
         self.smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
         self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
@@ -69,6 +75,37 @@ class EventDrivenService:
         
         return notifications
     
+    async def monitor_keywords_async(self, keywords: List[str], exact_match: bool = True):
+        """
+        Monitor hot posts for keyword mentions without blocking the event loop
+        
+        Collection runs in a worker thread; email and MQTT notifications are
+        sent concurrently.
+        
+        Args:
+            keywords: List of keywords to monitor
+            exact_match: Whether to use exact phrase matching
+        """
+        print(f"🔍 Monitoring hot posts for keywords: {keywords}")
+        
+        # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+        loop = asyncio.get_running_loop()
+        hot_posts = await loop.run_in_executor(None, self.realtime_service.collect_hot_posts)
+        
+        notifications = self.realtime_service.search_keywords_in_hot_posts(
+            keywords, hot_posts, exact_match
+        )
+        
+        if notifications:
+            await asyncio.gather(
+                loop.run_in_executor(None, self._send_notifications, notifications),
+                loop.run_in_executor(None, self._publish_mqtt_notifications, notifications)
+            )
+        
+        self._update_last_check_time()
+        
+        return notifications
+    
     
     def _send_notifications(self, notifications: List[Dict]):
         """Send email notifications"""
@@ -150,6 +187,36 @@ class EventDrivenService:
         
         return html
     
+    def _get_mqtt_client(self) -> mqtt.Client:
+        """Return the shared MQTT client, connecting it on first use"""
+        if self.mqtt_client is None:
+            client = mqtt.Client(callback_api_version=mqtt.CallbackAPIVersion.VERSION2)
+            
+            # Configure authentication if provided
+            if self.mqtt_username and self.mqtt_password:
+                client.username_pw_set(self.mqtt_username, self.mqtt_password)
+            
+            # Configure TLS if enabled
+            if self.mqtt_use_tls:
+                client.tls_set()
+            
+            # Let QoS 1 messages pipeline instead of waiting on each ack
+            client.max_inflight_messages_set(100)
+            client.reconnect_delay_set(min_delay=1, max_delay=60)
+            client.on_disconnect = self._on_mqtt_disconnect
+            
+            # Connect to broker; the background loop reconnects on its own
+            client.connect(self.mqtt_broker, self.mqtt_port, 60)
+            client.loop_start()
+            self.mqtt_client = client
+        
+        return self.mqtt_client
+    
+    def _on_mqtt_disconnect(self, client, userdata, disconnect_flags, reason_code, properties):
+        """Log unexpected disconnects; paho's network loop handles reconnection"""
+        if reason_code.is_failure:
+            print(f"⚠️ MQTT connection lost ({reason_code}), reconnecting...")
+    
     def _publish_mqtt_notifications(self, notifications: List[Dict]):
         """Publish notifications to MQTT broker"""
         if not self.mqtt_broker:
@@ -159,41 +226,60 @@ class EventDrivenService:
         print(f"📡 Publishing {len(notifications)} notifications to MQTT...")
         
         try:
-            if not self.mqtt_client:
-                self.mqtt_client = mqtt.Client()
-                
-                # Configure authentication if provided
-                if self.mqtt_username and self.mqtt_password:
-                    self.mqtt_client.username_pw_set(self.mqtt_username, self.mqtt_password)
-                
-                # Configure TLS if enabled
-                if self.mqtt_use_tls:
-                    self.mqtt_client.tls_set()
-                
-                # Connect to broker
-                self.mqtt_client.connect(self.mqtt_broker, self.mqtt_port, 60)
-                self.mqtt_client.loop_start()  # Start background loop
-            
+            client = self._get_mqtt_client()
+        except Exception as e:
+            print(f"❌ Failed to connect to MQTT broker: {e}")
+            return
+        
+        try:
+            # Queue every message first; acks are handled by the background loop
+            self._pending_publishes = [info for info in self._pending_publishes if not info.is_published()]
+            published = []
             for notification in notifications:
                 topic = f"buzzscope/alerts/{notification['keyword']}"
-                payload = json.dumps(notification, default=str)
+                payload = json_dumps(notification)
                 
                 # Publish with QoS 1 for reliability
-                result = self.mqtt_client.publish(topic, payload, qos=1)
-                
+                published.append((topic, client.publish(topic, payload, qos=1)))
+            
+            for topic, result in published:
                 if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                    print(f"  ✅ Published to {topic}")
+                    self._pending_publishes.append(result)
+                    print(f"  ✅ Queued for {topic}")
                 else:
                     print(f"  ❌ Failed to publish to {topic}: {result.rc}")
             
-            print("✅ MQTT notifications published successfully")
+            print("✅ MQTT notifications queued for delivery")
             
         except Exception as e:
             print(f"❌ Failed to publish MQTT notifications: {e}")
-            # Reset client to force reconnection on next attempt
-            if self.mqtt_client:
-                self.mqtt_client.disconnect()
-                self.mqtt_client = None
+    
+    def close(self, timeout: float = 10):
+        """
+        Wait for queued MQTT notifications to be acknowledged, then stop the
+        network loop and disconnect
+        
+        Args:
+            timeout: Seconds to wait in total for pending publishes
+        """
+        if self.mqtt_client:
+            deadline = time.monotonic() + timeout
+            undelivered = 0
+            for info in self._pending_publishes:
+                try:
+                    info.wait_for_publish(max(deadline - time.monotonic(), 0.001))
+                except (RuntimeError, ValueError):
+                    pass
+                if not info.is_published():
+                    undelivered += 1
+            self._pending_publishes = []
+            
+            if undelivered:
+                print(f"⚠️ {undelivered} MQTT notifications were not acknowledged before closing")
+            
+            self.mqtt_client.disconnect()
+            self.mqtt_client.loop_stop()
+            self.mqtt_client = None
     
     def _load_last_check_time(self) -> datetime:
         """Load last check time from file"""
@@ -225,26 +311,45 @@ class EventDrivenService:
             keywords: List of keywords to monitor
             interval_hours: Check interval in hours
         """
-        import time
-        
         print(f"🚀 Starting continuous monitoring...")
         print(f"   Keywords: {keywords}")
         print(f"   Interval: {interval_hours} hours")
         
-        while True:
+        try:
+            asyncio.run(self.run_monitoring(keywords, interval_hours))
+        except KeyboardInterrupt:
+            print("🛑 Monitoring stopped by user")
+        finally:
+            self.close()
+    
+    async def run_monitoring(self, keywords: List[str], interval_hours: int = 6,
+                             stop_event: Optional[asyncio.Event] = None):
+        """
+        Run monitoring checks on a schedule until stop_event is set
+        
+        Args:
+            keywords: List of keywords to monitor
+            interval_hours: Check interval in hours
+            stop_event: Event that ends the loop (and interrupts the wait) when set
+        """
+        stop_event = stop_event or asyncio.Event()
+        
+        while not stop_event.is_set():
             try:
-                notifications = self.monitor_keywords(keywords)
+                notifications = await self.monitor_keywords_async(keywords)
                 if notifications:
                     print(f"📢 Found {len(notifications)} mentions!")
                 else:
                     print("✅ No mentions found in current check")
                 
                 # Wait for next check
-                time.sleep(interval_hours * 3600)
+                delay = interval_hours * 3600
                 
-            except KeyboardInterrupt:
-                print("🛑 Monitoring stopped by user")
-                break
             except Exception as e:
                 print(f"❌ Error in monitoring loop: {e}")
-                time.sleep(300)  # Wait 5 minutes before retry
+                delay = 300  # Wait 5 minutes before retry
+            
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
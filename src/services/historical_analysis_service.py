@@ -3,15 +3,107 @@ Historical Analysis Service
 Uses pre-collected historical data for volume and trend analysis
 """
 import os
-import json
-from typing import Dict, List, Any, Optional
+import multiprocessing
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from ..collectors import RedditCollector, YouTubeCollector
 from ..analyzers.historical_analyzer import HistoricalAnalyzer
+from ..keyword_matcher import KeywordMatcher, word_check
+from ..serialization import json_loads, mapped_file
+
+# Optional import - ijson streams large JSON arrays without loading them whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Worker processes for scanning Discord exports (JSON decoding is CPU-bound)
+SCAN_WORKERS = os.cpu_count() or 1
+# Scans run while other threads (collectors, thread pools) may hold locks, so
+# worker processes must not be forked from this process
+SCAN_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+def _keyword_check(keyword: str, exact_match: bool) -> Callable[[str], bool]:
+    """Build a test for lowercased text, preparing the keyword once"""
+    keyword_lower = keyword.lower() if keyword else ''
+    
+    if not keyword_lower:
+        return lambda text_lower: False
+    if exact_match:
+        # For exact phrase matching, use word boundaries
+        return word_check(keyword_lower)
+    return lambda text_lower: keyword_lower in text_lower
+
+def _contains_keyword(text: str, keyword: str, exact_match: bool) -> bool:
+    """Check if text contains keyword"""
+    if not text or not keyword:
+        return False
+    
+    return bool(_keyword_check(keyword, exact_match)(text.lower()))
+
+def _stream_discord_messages(file_path: str) -> Iterator[Dict]:
+    """Stream messages from a Discord export (a list or {"messages": [...]}) with ijson"""
+    with open(file_path, 'rb') as f:
+        # The first non-whitespace byte tells which layout the export uses
+        first = b''
+        while True:
+            char = f.read(1)
+            if not char or not char.isspace():
+                first = char
+                break
+        f.seek(0)
+        
+        prefix = 'item' if first == b'[' else 'messages.item'
+        yield from ijson.items(f, prefix, use_float=True)
+
+def _scan_discord_file(file_path: str, community: str, keyword: str, exact_match: bool) -> List[Dict]:
+    """Search one Discord export file for keyword mentions (runs in a worker process)"""
+    posts = []
+    
+    try:
+        if file_path.endswith('.json'):
+            probe = KeywordMatcher([keyword])
+            
+            # Skip parsing files that can't mention the keyword at all
+            if ijson is not None:
+                if not probe.may_occur_in_file(file_path):
+                    return posts
+                messages = _stream_discord_messages(file_path)
+            else:
+                with mapped_file(file_path) as raw:
+                    if not probe.may_occur_in(raw):
+                        return posts
+                    
+                    data = json_loads(raw)
+                if isinstance(data, list):
+                    messages = data
+                else:
+                    messages = data.get('messages', [])
+            
+            check = _keyword_check(keyword, exact_match)
+            for message in messages:
+                content = message.get('content', '')
+                if content and check(content.lower()):
+                    posts.append({
+                        'content': content,
+                        'author': message.get('author', {}).get('name', 'Unknown'),
+                        'timestamp': message.get('timestamp', ''),
+                        'community': community
+                    })
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+    
+    return posts
 
 class HistoricalAnalysisService:
     """Service for analyzing historical data"""
     
+    # Most relevant posts kept from each real-time search
+    REALTIME_LIMIT = 100
+    
     def __init__(self):
         self.data_dir = "data"
         self.historical_analyzer = HistoricalAnalyzer()
@@ -19,6 +111,12 @@ class HistoricalAnalysisService:
         # Initialize real-time collectors for Reddit and YouTube
         self.reddit_collector = RedditCollector()
         self.youtube_collector = YouTubeCollector()
+        
+        # Directory listings keyed by path -> (mtime_ns, names), and the
+        # HN keyword -> files lookup built from the current listing
+        self._dir_listings: Dict[str, Tuple[int, List[str]]] = {}
+        self._hn_index: Dict[str, List[str]] = {}
+        self._hn_index_listing: Optional[List[str]] = None
     
     def analyze_keyword(self, keyword: str, exact_match: bool = True) -> Dict[str, Any]:
         """
@@ -40,21 +138,22 @@ class HistoricalAnalysisService:
             'platforms': {}
         }
         
-        # Analyze Hacker News (historical data)
-        hn_result = self._analyze_hackernews_historical(keyword, exact_match)
-        results['platforms']['hackernews'] = hn_result
-        
-        # Analyze Discord (historical data)
-        discord_result = self._analyze_discord_historical(keyword, exact_match)
-        results['platforms']['discord'] = discord_result
-        
-        # Analyze Reddit (real-time search with time=all)
-        reddit_result = self._analyze_reddit_realtime(keyword, exact_match)
-        results['platforms']['reddit'] = reddit_result
+        # Historical scans (HN, Discord) and real-time searches (Reddit, YouTube)
+        # are independent I/O-bound tasks, so run them concurrently
+        analyzers = {
+            'hackernews': self._analyze_hackernews_historical,
+            'discord': self._analyze_discord_historical,
+            'reddit': self._analyze_reddit_realtime,
+            'youtube': self._analyze_youtube_realtime
+        }
         
-        # Analyze YouTube (real-time search)
-        youtube_result = self._analyze_youtube_realtime(keyword, exact_match)
-        results['platforms']['youtube'] = youtube_result
+        with ThreadPoolExecutor(max_workers=len(analyzers)) as executor:
+            futures = {
+                platform: executor.submit(analyze, keyword, exact_match)
+                for platform, analyze in analyzers.items()
+            }
+            for platform, future in futures.items():
+                results['platforms'][platform] = future.result()
         
         return results
     
@@ -69,21 +168,21 @@ class HistoricalAnalysisService:
                 return {'error': 'No Hacker News historical data found'}
             
             # Look for keyword-specific files
-            keyword_files = []
-            for file in os.listdir(hn_data_dir):
-                if keyword.lower().replace(' ', '_') in file.lower():
-                    keyword_files.append(os.path.join(hn_data_dir, file))
+            keyword_files = self._hackernews_files(hn_data_dir, keyword)
             
             if not keyword_files:
                 return {'error': f'No historical data found for keyword: {keyword}'}
             
             # Load and analyze data
+            probe = KeywordMatcher([keyword])
             all_posts = []
             for file_path in keyword_files:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    posts = data.get('posts', [])
-                    all_posts.extend(posts)
+                with mapped_file(file_path) as raw:
+                    # With filtering on, files that can't mention the keyword contribute nothing
+                    if exact_match and not probe.may_occur_in(raw):
+                        continue
+                    
+                    all_posts.extend(json_loads(raw).get('posts', []))
             
             # Apply exact match filtering if needed
             if exact_match:
@@ -102,6 +201,30 @@ class HistoricalAnalysisService:
         except Exception as e:
             return {'error': f'Hacker News analysis failed: {str(e)}'}
     
+    def _list_dir(self, path: str) -> List[str]:
+        """List a directory, re-reading it only when its mtime changes"""
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._dir_listings.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, os.listdir(path))
+            self._dir_listings[path] = cached
+        return cached[1]
+    
+    def _hackernews_files(self, hn_data_dir: str, keyword: str) -> List[str]:
+        """Find the HN historical files named after a keyword"""
+        files = self._list_dir(hn_data_dir)
+        if self._hn_index_listing is not files:
+            # Directory changed since the index was built
+            self._hn_index = {}
+            self._hn_index_listing = files
+        
+        key = keyword.lower().replace(' ', '_')
+        if key not in self._hn_index:
+            self._hn_index[key] = [
+                os.path.join(hn_data_dir, file) for file in files if key in file.lower()
+            ]
+        return self._hn_index[key]
+    
     def _analyze_discord_historical(self, keyword: str, exact_match: bool) -> Dict[str, Any]:
         """Analyze Discord using historical data"""
         print(f"  📱 Analyzing Discord (historical)...")
@@ -113,14 +236,18 @@ class HistoricalAnalysisService:
                 return {'error': 'No Discord historical data found'}
             
             # Search through all community directories
-            all_posts = []
             communities = ['industry40', 'soliscada', 'supos']
             
+            jobs = []
             for community in communities:
                 community_dir = os.path.join(discord_data_dir, community)
                 if os.path.exists(community_dir):
-                    posts = self._search_discord_community(community_dir, keyword, exact_match)
-                    all_posts.extend(posts)
+                    for file in self._list_dir(community_dir):
+                        # Only JSON exports are searched; CSV exports have no reader here
+                        if file.endswith('.json'):
+                            jobs.append((os.path.join(community_dir, file), community))
+            
+            all_posts = self._search_discord_files(jobs, keyword, exact_match)
             
             return {
                 'status': 'success',
@@ -143,12 +270,10 @@ class HistoricalAnalysisService:
                 keyword=keyword,
                 days_back=365*5,  # 5 years
                 exact_match=exact_match,
-                use_global=True
+                use_global=True,
+                limit=self.REALTIME_LIMIT  # Stops querying subreddits once enough posts are found
             )
             
-            # Limit to top 100 most relevant posts
-            posts = posts[:100]
-            
             return {
                 'status': 'success',
                 'total_posts': len(posts),
@@ -169,12 +294,10 @@ class HistoricalAnalysisService:
             posts = self.youtube_collector.search_keyword(
                 keyword=keyword,
                 days_back=365*5,  # 5 years
-                exact_match=exact_match
+                exact_match=exact_match,
+                limit=self.REALTIME_LIMIT
             )
             
-            # Limit to top 100 most relevant videos
-            posts = posts[:100]
-            
             return {
                 'status': 'success',
                 'total_posts': len(posts),
@@ -186,60 +309,33 @@ class HistoricalAnalysisService:
         except Exception as e:
             return {'error': f'YouTube analysis failed: {str(e)}'}
     
-    def _search_discord_community(self, community_dir: str, keyword: str, exact_match: bool) -> List[Dict]:
-        """Search Discord community directory for keyword mentions"""
-        posts = []
-        
-        for file in os.listdir(community_dir):
-            if file.endswith(('.json', '.csv')):
-                file_path = os.path.join(community_dir, file)
-                try:
-                    if file.endswith('.json'):
-                        with open(file_path, 'r') as f:
-                            data = json.load(f)
-                            if isinstance(data, list):
-                                messages = data
-                            else:
-                                messages = data.get('messages', [])
-                            
-                            for message in messages:
-                                content = message.get('content', '')
-                                if self._contains_keyword(content, keyword, exact_match):
-                                    posts.append({
-                                        'content': content,
-                                        'author': message.get('author', {}).get('name', 'Unknown'),
-                                        'timestamp': message.get('timestamp', ''),
-                                        'community': os.path.basename(community_dir)
-                                    })
-                except Exception as e:
-                    print(f"Error reading {file_path}: {e}")
-                    continue
+    def _search_discord_files(self, jobs: List[tuple], keyword: str, exact_match: bool) -> List[Dict]:
+        """Search (file_path, community) Discord exports for keyword mentions across worker processes"""
+        if len(jobs) <= 1:
+            # Nothing (or too little) to scan to be worth starting worker processes
+            results = [_scan_discord_file(*job, keyword, exact_match) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=min(SCAN_WORKERS, len(jobs)), mp_context=SCAN_CONTEXT) as executor:
+                futures = [executor.submit(_scan_discord_file, *job, keyword, exact_match) for job in jobs]
+                results = [future.result() for future in futures]
         
+        posts = []
+        for file_posts in results:
+            posts.extend(file_posts)
         return posts
     
     def _contains_keyword(self, text: str, keyword: str, exact_match: bool) -> bool:
         """Check if text contains keyword"""
-        if not text or not keyword:
-            return False
-        
-        text_lower = text.lower()
-        keyword_lower = keyword.lower()
-        
-        if exact_match:
-            return keyword_lower in text_lower
-        else:
-            # For exact phrase matching, use word boundaries
-            import re
-            pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-            return bool(re.search(pattern, text_lower))
+        return _contains_keyword(text, keyword, exact_match)
     
     def _filter_exact_match(self, posts: List[Dict], keyword: str) -> List[Dict]:
         """Filter posts for exact keyword matches"""
+        check = _keyword_check(keyword, True)
         filtered = []
         for post in posts:
             title = post.get('title', '')
             content = post.get('content', '')
-            if self._contains_keyword(title + ' ' + content, keyword, True):
+            if check((title + ' ' + content).lower()):
                 filtered.append(post)
         return filtered
     
@@ -248,7 +344,8 @@ class HistoricalAnalysisService:
         if not posts:
             return {'start': None, 'end': None}
         
-        timestamps = []
+        # Track the endpoints in one pass instead of sorting every timestamp
+        start = end = None
         for post in posts:
             timestamp = post.get('timestamp', '')
             if timestamp:
@@ -258,15 +355,21 @@ class HistoricalAnalysisService:
                         dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
                     else:
                         dt = timestamp
-                    timestamps.append(dt)
                 except:
                     continue
+                
+                if start is None:
+                    start = end = dt
+                elif dt < start:
+                    start = dt
+                elif dt >= end:
+                    # Ties keep the last one, as the end of a stable sort would
+                    end = dt
         
-        if timestamps:
-            timestamps.sort()
+        if start is not None:
             return {
-                'start': timestamps[0].isoformat(),
-                'end': timestamps[-1].isoformat()
+                'start': start.isoformat(),
+                'end': end.isoformat()
             }
         
         return {'start': None, 'end': None}
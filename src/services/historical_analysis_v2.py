@@ -3,13 +3,20 @@ Historical Data Analysis Service V2
 专门用于分析历史数据的声量统计、趋势分析和横向对比
 """
 
-import json
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime
 from typing import Dict, List, Any, Optional, Tuple
-from collections import Counter, defaultdict
+from collections import OrderedDict, defaultdict
 import os
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+
+from ..serialization import json_loads
 
 @dataclass
 class PlatformMetrics:
@@ -33,13 +40,90 @@ class ComparisonMetrics:
     cross_platform_insights: List[str]
     top_keywords: List[Tuple[str, int]]
 
+def _copy_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """复制缓存的解析结果（含帖子列表及每个帖子），调用方修改时不影响缓存"""
+    copied = dict(data)
+    posts = copied.get("posts")
+    if isinstance(posts, list):
+        copied["posts"] = [dict(post) if isinstance(post, dict) else post for post in posts]
+    return copied
+
+# 各平台的作者及帖子链接生成方式（按平台查表，避免逐个比较）
+_AUTHOR_URLS = {
+    'reddit': lambda author: f"https://reddit.com/u/{author}",
+    'youtube': lambda author: f"https://youtube.com/@{author.replace(' ', '')}",
+    'hackernews': lambda author: f"https://news.ycombinator.com/user?id={author}",
+    'discord': lambda author: f"https://discord.com/users/{author}"
+}
+
+_POST_URLS = {
+    'reddit': lambda post: f"https://reddit.com{post.get('permalink', '')}",
+    'youtube': lambda post: f"https://youtube.com/watch?v={post.get('video_id', '')}",
+    'hackernews': lambda post: f"https://news.ycombinator.com/item?id={post.get('id', '')}",
+    'discord': lambda post: post.get('jump_url', '')
+}
+
+# 按天计数时直接 bincount 的最大日期跨度（约100年），更大的跨度改用排序计数
+MAX_BINCOUNT_DAYS = 36_600
+
+# fromisoformat 失败时依次尝试的格式（已去掉 'Z'）
+_DATE_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S"
+]
+
+@lru_cache(maxsize=100_000)
+def _parse_date_str(date_str: str) -> Optional[datetime]:
+    """解析日期字符串（结果缓存，同一时间戳只解析一次）"""
+    # 绝大多数时间戳是ISO格式，直接用C实现的fromisoformat解析；
+    # 带 'Z' 的时间戳走下面的原有流程，以保持相同的时区处理
+    if 'Z' not in date_str:
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
+    # 兼容strptime可接受的非补零写法
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str.replace('Z', ''), fmt)
+        except ValueError:
+            continue
+    
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
 class HistoricalAnalysisV2:
     """历史数据分析服务V2"""
     
+    # 内存中最多保留的已解析文件数
+    DATA_CACHE_SIZE = 128
+    
+    # 各平台互动数与作者对应的字段
+    INTERACTION_FIELDS = {
+        'reddit': ['score', 'num_comments'],
+        'youtube': ['view_count', 'like_count', 'comment_count'],
+        'hackernews': ['score', 'descendants'],
+        'discord': ['reactions']
+    }
+    AUTHOR_FIELDS = {
+        'reddit': 'author',
+        'youtube': 'channel_title',
+        'hackernews': 'by',
+        'discord': 'author'
+    }
+    
     def __init__(self, cache_dir: str = "data/cache"):
         self.cache_dir = cache_dir
         self.platforms = ["hackernews", "reddit", "youtube", "discord"]
         self.default_keywords = ["ai", "iot", "mqtt", "unified_namespace"]
+        
+        # 已解析的缓存文件: (platform, keyword) -> ((mtime_ns, size), data)
+        self._data_cache: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+        self._data_cache_lock = threading.Lock()
     
     def load_platform_data(self, platform: str, keyword: str) -> Dict[str, Any]:
         """加载平台数据"""
@@ -48,9 +132,27 @@ class HistoricalAnalysisV2:
             return {"status": "error", "posts": []}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data
+            # 文件未变化时直接复用上次解析结果
+            st = os.stat(file_path)
+            version = (st.st_mtime_ns, st.st_size)
+            key = (platform, keyword)
+            
+            with self._data_cache_lock:
+                hit = self._data_cache.get(key)
+                if hit is not None and hit[0] == version:
+                    self._data_cache.move_to_end(key)
+                    return _copy_data(hit[1])
+            
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
+            
+            with self._data_cache_lock:
+                self._data_cache[key] = (version, data)
+                self._data_cache.move_to_end(key)
+                while len(self._data_cache) > self.DATA_CACHE_SIZE:
+                    self._data_cache.popitem(last=False)
+            
+            return _copy_data(data)
         except Exception as e:
             print(f"Error loading {file_path}: {e}")
             return {"status": "error", "posts": []}
@@ -74,47 +176,71 @@ class HistoricalAnalysisV2:
                 weekly_mentions={}
             )
         
+        # 一次性转换为DataFrame，按列向量化计算
+        df = pd.DataFrame(posts)
+        interactions = self._interaction_counts(df)
+        authors = self._author_series(df)
+        authors = authors[authors.notna() & (authors != '')]
+        
+        # 每位作者的发帖数只统计一次，独特作者数与Top贡献者共用
+        # 按首次出现顺序分组，稳定排序后与Counter.most_common结果一致
+        author_counts = authors.groupby(authors, sort=False).size().sort_values(ascending=False, kind='stable')
+        
         # 计算基础指标
         total_posts = len(posts)
-        total_interactions = sum(self._get_interaction_count(post) for post in posts)
-        unique_authors = len(set(self._get_author(post) for post in posts if self._get_author(post)))
+        total_interactions = int(interactions.sum())
+        unique_authors = len(author_counts)
         
-        # 计算时间范围
+        # 每个帖子的日期只解析一次，时间范围与每日/每周统计共用
         dates = [self._parse_date(post.get('created_at', '')) for post in posts]
-        dates = [d for d in dates if d is not None]
-        date_range = (min(dates), max(dates)) if dates else (datetime.now(), datetime.now())
+        
+        # 计算时间范围（单次遍历记录最早/最晚时间）
+        earliest = latest = None
+        for parsed in dates:
+            if parsed is None:
+                continue
+            if earliest is None:
+                earliest = latest = parsed
+            elif parsed < earliest:
+                earliest = parsed
+            elif parsed > latest:
+                latest = parsed
+        date_range = (earliest, latest) if earliest is not None else (datetime.now(), datetime.now())
         
         # 计算Top贡献者
-        author_counts = Counter(self._get_author(post) for post in posts if self._get_author(post))
         top_contributors = [
             {
                 "author": author,
-                "post_count": count,
+                "post_count": int(count),
                 "platform": platform,
                 "profile_url": self._get_author_url(platform, author)
             }
-            for author, count in author_counts.most_common(10)
+            for author, count in author_counts.head(10).items()
         ]
         
         # 计算Top帖子
-        top_posts = sorted(posts, key=lambda x: self._get_interaction_count(x), reverse=True)[:10]
+        # 只需前10个：nlargest为O(N log 10)，且与sorted(..., reverse=True)[:10]顺序一致
+        interaction_values = interactions.tolist()
+        top_indices = nlargest(10, range(total_posts), key=interaction_values.__getitem__)
         top_posts = [
             {
-                "title": post.get('title', 'No title'),
-                "interactions": self._get_interaction_count(post),
-                "author": self._get_author(post),
-                "created_at": post.get('created_at', ''),
-                "url": self._get_post_url(platform, post),
+                "title": posts[i].get('title', 'No title'),
+                "interactions": interaction_values[i],
+                "author": self._get_author(posts[i]),
+                "created_at": posts[i].get('created_at', ''),
+                "url": self._get_post_url(platform, posts[i]),
                 "platform": platform
             }
-            for post in top_posts
+            for i in top_indices
         ]
         
+        day_counts = self._count_day_ordinals(dates)
+        
         # 计算每日提及
-        daily_mentions = self._calculate_daily_mentions(posts)
+        daily_mentions = self._calculate_daily_mentions(day_counts)
         
         # 计算每周提及
-        weekly_mentions = self._calculate_weekly_mentions(posts)
+        weekly_mentions = self._calculate_weekly_mentions(day_counts)
         
         return PlatformMetrics(
             platform=platform,
@@ -131,9 +257,20 @@ class HistoricalAnalysisV2:
     
     def analyze_keyword(self, keyword: str) -> Dict[str, PlatformMetrics]:
         """分析单个关键词在所有平台的指标"""
-        results = {}
-        for platform in self.platforms:
-            results[platform] = self.calculate_platform_metrics(platform, keyword)
+        return self._analyze_keywords([keyword])[keyword]
+    
+    def _analyze_keywords(self, keywords: List[str]) -> Dict[str, Dict[str, PlatformMetrics]]:
+        """并发计算多个关键词在所有平台的指标"""
+        with ThreadPoolExecutor(max_workers=min(32, len(keywords) * len(self.platforms) or 1)) as executor:
+            futures = {
+                (keyword, platform): executor.submit(self.calculate_platform_metrics, platform, keyword)
+                for keyword in keywords
+                for platform in self.platforms
+            }
+        
+        results = {keyword: {} for keyword in keywords}
+        for (keyword, platform), future in futures.items():
+            results[keyword][platform] = future.result()
         return results
     
     def compare_keywords(self, keywords: Optional[List[str]] = None) -> ComparisonMetrics:
@@ -145,19 +282,22 @@ class HistoricalAnalysisV2:
         all_metrics = {}
         
         # 收集所有关键词的指标
-        for keyword in keywords:
-            all_metrics[keyword] = self.analyze_keyword(keyword)
+        all_metrics.update(self._analyze_keywords(keywords))
         
-        # 计算平台总计
+        # 计算平台总计（每个平台只遍历一次所有关键词的指标）
         for platform in self.platforms:
+            total_posts = total_interactions = 0
+            authors = set()
+            for metrics in all_metrics.values():
+                platform_metrics = metrics[platform]
+                total_posts += platform_metrics.total_posts
+                total_interactions += platform_metrics.total_interactions
+                authors.update(author["author"] for author in platform_metrics.top_contributors)
+            
             platform_totals[platform] = {
-                "total_posts": sum(metrics[platform].total_posts for metrics in all_metrics.values()),
-                "total_interactions": sum(metrics[platform].total_interactions for metrics in all_metrics.values()),
-                "unique_authors": len(set(
-                    author["author"] 
-                    for metrics in all_metrics.values() 
-                    for author in metrics[platform].top_contributors
-                ))
+                "total_posts": total_posts,
+                "total_interactions": total_interactions,
+                "unique_authors": len(authors)
             }
         
         # 计算关键词排名
@@ -168,7 +308,7 @@ class HistoricalAnalysisV2:
                 for platform in self.platforms
             )
         
-        top_keywords = sorted(keyword_totals.items(), key=lambda x: x[1], reverse=True)
+        top_keywords = sorted(keyword_totals.items(), key=itemgetter(1), reverse=True)
         
         # 生成跨平台洞察
         cross_platform_insights = self._generate_insights(all_metrics, platform_totals)
@@ -180,114 +320,99 @@ class HistoricalAnalysisV2:
             top_keywords=top_keywords
         )
     
-    def _get_interaction_count(self, post: Dict[str, Any]) -> int:
-        """获取帖子的互动数"""
-        platform = post.get('platform', '')
-        
-        if platform == 'reddit':
-            return post.get('score', 0) + post.get('num_comments', 0)
-        elif platform == 'youtube':
-            return (post.get('view_count', 0) or 0) + (post.get('like_count', 0) or 0) + (post.get('comment_count', 0) or 0)
-        elif platform == 'hackernews':
-            return post.get('score', 0) + post.get('descendants', 0)
-        elif platform == 'discord':
-            return post.get('reactions', 0) or 0
-        else:
-            return 0
+    def _interaction_counts(self, df: pd.DataFrame) -> np.ndarray:
+        """向量化计算每个帖子的互动数"""
+        counts = np.zeros(len(df), dtype=np.int64)
+        if 'platform' not in df:
+            return counts
+        
+        for name, fields in self.INTERACTION_FIELDS.items():
+            mask = (df['platform'] == name).to_numpy(dtype=bool, na_value=False)
+            if not mask.any():
+                continue
+            for field in fields:
+                if field in df:
+                    values = pd.to_numeric(df.loc[mask, field], errors='coerce').fillna(0)
+                    counts[mask] += values.to_numpy(dtype=np.int64)
+        return counts
+    
+    def _author_series(self, df: pd.DataFrame) -> pd.Series:
+        """向量化获取每个帖子的作者"""
+        authors = pd.Series(None, index=df.index, dtype=object)
+        if 'platform' not in df:
+            return authors
+        
+        for name, field in self.AUTHOR_FIELDS.items():
+            mask = (df['platform'] == name).to_numpy(dtype=bool, na_value=False)
+            if mask.any():
+                authors[mask] = df.loc[mask, field].astype(object) if field in df else ''
+        return authors
     
     def _get_author(self, post: Dict[str, Any]) -> Optional[str]:
         """获取帖子作者"""
-        platform = post.get('platform', '')
-        
-        if platform == 'reddit':
-            return post.get('author', '')
-        elif platform == 'youtube':
-            return post.get('channel_title', '')
-        elif platform == 'hackernews':
-            return post.get('by', '')
-        elif platform == 'discord':
-            return post.get('author', '')
-        else:
-            return None
+        field = self.AUTHOR_FIELDS.get(post.get('platform', ''))
+        return post.get(field, '') if field else None
     
     def _get_author_url(self, platform: str, author: str) -> str:
         """获取作者链接"""
-        if platform == 'reddit':
-            return f"https://reddit.com/u/{author}"
-        elif platform == 'youtube':
-            return f"https://youtube.com/@{author.replace(' ', '')}"
-        elif platform == 'hackernews':
-            return f"https://news.ycombinator.com/user?id={author}"
-        elif platform == 'discord':
-            return f"https://discord.com/users/{author}"
-        else:
-            return ""
+        build = _AUTHOR_URLS.get(platform)
+        return build(author) if build else ""
     
     def _get_post_url(self, platform: str, post: Dict[str, Any]) -> str:
         """获取帖子链接"""
-        if platform == 'reddit':
-            return f"https://reddit.com{post.get('permalink', '')}"
-        elif platform == 'youtube':
-            return f"https://youtube.com/watch?v={post.get('video_id', '')}"
-        elif platform == 'hackernews':
-            return f"https://news.ycombinator.com/item?id={post.get('id', '')}"
-        elif platform == 'discord':
-            return post.get('jump_url', '')
-        else:
-            return ""
+        build = _POST_URLS.get(platform)
+        return build(post) if build else ""
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """解析日期字符串"""
-        if not date_str:
-            return None
-        
-        try:
-            # 尝试多种日期格式
-            formats = [
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-                "%Y-%m-%d %H:%M:%S"
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_str.replace('Z', ''), fmt)
-                except ValueError:
-                    continue
-            
-            # 如果都失败，尝试ISO格式
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except:
+        if not date_str or not isinstance(date_str, str):
             return None
+        return _parse_date_str(date_str)
+    
+    def _calculate_daily_mentions(self, day_counts: Tuple[np.ndarray, np.ndarray]) -> Dict[str, int]:
+        """根据日序数计数计算每日提及数"""
+        days, counts = day_counts
+        # 日期按整数序数分桶，只对每个不同的日期格式化一次；isoformat即YYYY-MM-DD
+        return {
+            date.fromordinal(day).isoformat(): count
+            for day, count in zip(days.tolist(), counts.tolist())
+        }
     
-    def _calculate_daily_mentions(self, posts: List[Dict[str, Any]]) -> Dict[str, int]:
-        """计算每日提及数"""
-        daily_counts = defaultdict(int)
+    def _calculate_weekly_mentions(self, day_counts: Tuple[np.ndarray, np.ndarray]) -> Dict[str, int]:
+        """根据日序数计数计算每周提及数"""
+        days, counts = day_counts
         
-        for post in posts:
-            date = self._parse_date(post.get('created_at', ''))
-            if date:
-                date_str = date.strftime('%Y-%m-%d')
-                daily_counts[date_str] += 1
+        # 获取该周的周一（序数1为周一）
+        mondays = days - (days - 1) % 7
+        mondays, first = np.unique(mondays, return_index=True)
+        week_counts = np.add.reduceat(counts, first) if len(counts) else counts
         
-        return dict(daily_counts)
-    
-    def _calculate_weekly_mentions(self, posts: List[Dict[str, Any]]) -> Dict[str, int]:
-        """计算每周提及数"""
         weekly_counts = defaultdict(int)
-        
-        for post in posts:
-            date = self._parse_date(post.get('created_at', ''))
-            if date:
-                # 获取该周的周一
-                monday = date - timedelta(days=date.weekday())
-                week_str = monday.strftime('%Y-W%U')
-                weekly_counts[week_str] += 1
+        for monday, count in zip(mondays.tolist(), week_counts.tolist()):
+            week_str = date.fromordinal(monday).strftime('%Y-W%U')
+            weekly_counts[week_str] += count
         
         return dict(weekly_counts)
     
+    def _count_day_ordinals(self, dates: List[Optional[datetime]]) -> Tuple[np.ndarray, np.ndarray]:
+        """将已解析的帖子日期转换为日序数并计数，返回(升序日序数, 对应帖子数)"""
+        ordinals = np.fromiter(
+            (parsed.toordinal() for parsed in dates if parsed),
+            dtype=np.int64
+        )
+        if not len(ordinals):
+            return np.unique(ordinals, return_counts=True)
+        
+        # 日期跨度不大时按天 bincount（线性计数，无需排序），再去掉空桶
+        first_day = int(ordinals.min())
+        span = int(ordinals.max()) - first_day + 1
+        if span > MAX_BINCOUNT_DAYS:
+            return np.unique(ordinals, return_counts=True)
+        
+        counts = np.bincount(ordinals - first_day, minlength=span)
+        days = np.flatnonzero(counts)
+        return days + first_day, counts[days]
+    
     def _generate_insights(self, all_metrics: Dict[str, Dict[str, PlatformMetrics]], 
                           platform_totals: Dict[str, Dict[str, int]]) -> List[str]:
         """生成跨平台洞察"""
@@ -3,14 +3,19 @@ Real-time Data Collection Service
 Collects hot posts for event-driven notifications
 """
 import os
-import json
 import logging
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from ..collectors import HackerNewsCollector, RedditCollector, YouTubeCollector
 from ..config import Config
+from ..keyword_matcher import KeywordMatcher, contains_word
+from ..serialization import json_dumps, json_loads, mapped_file
+
+# Start of the header line written before each collection in a daily hot posts log
+_COLLECTION_HEADER = b'{"collection_time":'
 
 class RealtimeCollectionService:
     """Service for collecting real-time hot posts"""
@@ -30,6 +35,13 @@ class RealtimeCollectionService:
             'youtube': YouTubeCollector()
         }
         
+        # ((file, mtime_ns, size), parsed latest collection) of the last file read
+        self._latest_cache: Optional[Tuple[Tuple[Path, int, int], Tuple[str, Dict[str, List[Dict]]]]] = None
+        
+        # Daily log -> (bytes counted, collections in them); logs only grow, so
+        # later counts only scan what was appended since
+        self._collection_counts: Dict[Path, Tuple[int, int]] = {}
+        
         self.logger.info("RealtimeCollectionService initialized")
     
     def collect_hot_posts(self, limit_per_platform: int = 50) -> Dict[str, List[Dict]]:
@@ -51,27 +63,34 @@ class RealtimeCollectionService:
         }
         
         collection_time = datetime.now()
+        collected_at = collection_time.isoformat()
         
-        # Collect from each platform
-        for platform, collector in self.collectors.items():
-            try:
+        # Collect from each platform concurrently (independent, I/O-bound API calls)
+        with ThreadPoolExecutor(max_workers=len(self.collectors)) as executor:
+            futures = {}
+            for platform, collector in self.collectors.items():
                 self.logger.info(f"Collecting hot posts from {platform}")
-                posts = collector.get_recent_posts(limit=limit_per_platform)
-                
-                # Convert posts to dictionaries
-                platform_posts = []
-                for post in posts:
-                    post_dict = self._post_to_dict(post)
-                    post_dict['platform'] = platform
-                    post_dict['collection_time'] = collection_time.isoformat()
-                    platform_posts.append(post_dict)
-                
-                hot_posts[platform] = platform_posts
-                self.logger.info(f"Collected {len(platform_posts)} posts from {platform}")
-                
-            except Exception as e:
-                self.logger.error(f"Error collecting hot posts from {platform}: {e}")
-                hot_posts[platform] = []
+                futures[executor.submit(collector.get_recent_posts, limit=limit_per_platform)] = platform
+            
+            for future in as_completed(futures):
+                platform = futures[future]
+                try:
+                    posts = future.result()
+                    
+                    # Convert posts to dictionaries
+                    platform_posts = []
+                    for post in posts:
+                        post_dict = self._post_to_dict(post)
+                        post_dict['platform'] = platform
+                        post_dict['collection_time'] = collected_at
+                        platform_posts.append(post_dict)
+                    
+                    hot_posts[platform] = platform_posts
+                    self.logger.info(f"Collected {len(platform_posts)} posts from {platform}")
+                    
+                except Exception as e:
+                    self.logger.error(f"Error collecting hot posts from {platform}: {e}")
+                    hot_posts[platform] = []
         
         # Save hot posts
         self._save_hot_posts(hot_posts, collection_time)
@@ -95,34 +114,32 @@ class RealtimeCollectionService:
         if hot_posts is None:
             hot_posts = self.collect_hot_posts()
         
-        mentions = []
-        
-        for keyword in keywords:
-            keyword_mentions = self._find_keyword_mentions(
-                hot_posts, keyword, exact_match
-            )
-            mentions.extend(keyword_mentions)
-        
-        return mentions
+        return self._find_keyword_mentions(hot_posts, keywords, exact_match)
     
     def _find_keyword_mentions(self, hot_posts: Dict[str, List[Dict]], 
-                              keyword: str, exact_match: bool) -> List[Dict]:
-        """Find keyword mentions in hot posts"""
-        mentions = []
+                              keywords: List[str], exact_match: bool) -> List[Dict]:
+        """Find keyword mentions in hot posts, scanning each post once for all keywords"""
+        matcher = KeywordMatcher(keywords, exact_match)
+        found_at = datetime.now().isoformat()
+        keyword_mentions = {keyword: [] for keyword in keywords}
         
         for platform, posts in hot_posts.items():
             for post in posts:
                 title = post.get('title', '')
                 content = post.get('content', '')
                 
-                if self._contains_keyword(title + ' ' + content, keyword, exact_match):
-                    mention = {
+                for keyword in matcher.find(title + ' ' + content):
+                    keyword_mentions[keyword].append({
                         'keyword': keyword,
                         'platform': platform,
                         'post': post,
-                        'found_at': datetime.now().isoformat()
-                    }
-                    mentions.append(mention)
+                        'found_at': found_at
+                    })
+        
+        # Group mentions by keyword in the order the keywords were given
+        mentions = []
+        for keyword in keywords:
+            mentions.extend(keyword_mentions[keyword])
         
         return mentions
     
@@ -135,98 +152,198 @@ class RealtimeCollectionService:
         keyword_lower = keyword.lower()
         
         if exact_match:
-            import re
-            pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-            return bool(re.search(pattern, text_lower))
+            return contains_word(text_lower, keyword_lower)
         else:
             return keyword_lower in text_lower
     
     def _post_to_dict(self, post) -> Dict[str, Any]:
         """Convert post object to dictionary"""
-        if hasattr(post, '__dict__'):
-            return post.__dict__
-        elif isinstance(post, dict):
+        if isinstance(post, dict):
             return post
-        else:
-            return {'content': str(post)}
+        
+        # Copy the fields so tagging the dict doesn't modify the post object
+        fields = getattr(post, '__dict__', None)
+        if fields is not None:
+            return dict(fields)
+        return {'content': str(post)}
     
     def _save_hot_posts(self, hot_posts: Dict[str, List[Dict]], collection_time: datetime):
-        """Save hot posts to file"""
-        filename = f"hot_posts_{collection_time.strftime('%Y%m%d_%H%M%S')}.json"
+        """
+        Append hot posts to today's log file
+        
+        Each collection is one header line followed by one line per post, so
+        saving only writes the new posts instead of a whole snapshot.
+        """
+        filename = f"hot_posts_{collection_time.strftime('%Y%m%d')}.jsonl"
         filepath = self.realtime_dir / filename
         
-        data = {
+        header = {
             'collection_time': collection_time.isoformat(),
-            'platforms': hot_posts,
+            'platforms': list(hot_posts),
             'total_posts': sum(len(posts) for posts in hot_posts.values())
         }
         
+        lines = [json_dumps(header)]
+        for platform, posts in hot_posts.items():
+            lines.extend(json_dumps({'platform': platform, 'post': post}) for post in posts)
+        
         try:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            # A single append keeps the collection's lines together
+            with open(filepath, 'ab') as f:
+                start = f.tell()
+                f.write(b'\n'.join(lines) + b'\n')
+                end = f.tell()
+            
+            # Count the new collection without rescanning the log
+            counted = self._collection_counts.get(filepath, (0, 0))
+            if counted[0] == start:
+                self._collection_counts[filepath] = (end, counted[1] + 1)
             self.logger.info(f"Hot posts saved to {filepath}")
         except Exception as e:
             self.logger.error(f"Error saving hot posts: {e}")
     
-    def get_latest_hot_posts(self) -> Optional[Dict[str, List[Dict]]]:
-        """Get the most recent hot posts"""
-        hot_post_files = list(self.realtime_dir.glob('hot_posts_*.json'))
-        
-        if not hot_post_files:
+    def _load_latest_collection(self) -> Optional[Tuple[str, Dict[str, List[Dict]]]]:
+        """Load (collection_time, posts by platform) of the most recent collection"""
+        # Older per-collection snapshots are only read until a daily log exists
+        latest_file = (
+            self._latest_file('hot_posts_*.jsonl') or
+            self._latest_file('hot_posts_*.json')
+        )
+        if latest_file is None:
             return None
         
-        # Get the most recent file
-        latest_file = max(hot_post_files, key=lambda f: f.stat().st_mtime)
+        # Reuse the last parse while the file is unchanged (logs only grow when appended to)
+        file_stat = latest_file.stat()
+        key = (latest_file, file_stat.st_mtime_ns, file_stat.st_size)
+        if self._latest_cache is None or self._latest_cache[0] != key:
+            if latest_file.suffix == '.jsonl':
+                latest = self._parse_latest_log(latest_file)
+            else:
+                latest = self._parse_snapshot(latest_file)
+            self._latest_cache = (key, latest)
+        
+        collection_time, platforms = self._latest_cache[1]
+        return collection_time, {platform: list(posts) for platform, posts in platforms.items()}
+    
+    def _latest_file(self, pattern: str) -> Optional[Path]:
+        """Most recent hot posts file matching pattern (names embed a sortable date)"""
+        return max(self.realtime_dir.glob(pattern), key=lambda f: f.name, default=None)
+    
+    def _parse_latest_log(self, log_file: Path) -> Tuple[str, Dict[str, List[Dict]]]:
+        """Parse the last collection appended to a daily log"""
+        # Only the lines after the last collection header are parsed
+        with mapped_file(log_file) as raw:
+            start = raw.rfind(b'\n' + _COLLECTION_HEADER) + 1
+            lines = raw[start:].splitlines()
+        
+        header = json_loads(lines[0])
+        platforms = {platform: [] for platform in header.get('platforms', [])}
+        for line in lines[1:]:
+            record = json_loads(line)
+            platforms.setdefault(record['platform'], []).append(record['post'])
         
+        return header.get('collection_time'), platforms
+    
+    def _parse_snapshot(self, snapshot_file: Path) -> Tuple[str, Dict[str, List[Dict]]]:
+        """Parse a per-collection snapshot written before the daily logs"""
+        data = json_loads(snapshot_file.read_bytes())
+        return data.get('collection_time'), data.get('platforms', {})
+    
+    def get_latest_hot_posts(self) -> Optional[Dict[str, List[Dict]]]:
+        """Get the most recent hot posts"""
         try:
-            with open(latest_file, 'r') as f:
-                data = json.load(f)
-                return data.get('platforms', {})
+            latest = self._load_latest_collection()
         except Exception as e:
             self.logger.error(f"Error loading latest hot posts: {e}")
             return None
+        
+        if latest is None:
+            return None
+        return latest[1]
     
     def cleanup_old_hot_posts(self, days_to_keep: int = 7):
         """Clean up old hot posts files"""
         cutoff_time = datetime.now() - timedelta(days=days_to_keep)
         
-        for file_path in self.realtime_dir.glob('hot_posts_*.json'):
+        for file_path in self._hot_post_files():
             try:
-                file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
+                file_time = self._snapshot_time(file_path)
                 if file_time < cutoff_time:
                     file_path.unlink()
                     self.logger.info(f"Deleted old hot posts file: {file_path}")
             except Exception as e:
                 self.logger.error(f"Error deleting {file_path}: {e}")
     
+    def _hot_post_files(self) -> List[Path]:
+        """Daily hot post logs plus any older per-collection snapshots"""
+        return list(self.realtime_dir.glob('hot_posts_*.jsonl')) + list(self.realtime_dir.glob('hot_posts_*.json'))
+    
+    def _snapshot_time(self, file_path: Path) -> datetime:
+        """Time of the last collection a hot posts file can hold, from its name"""
+        stamp = file_path.stem[len('hot_posts_'):]
+        try:
+            if file_path.suffix == '.jsonl':
+                # Daily log: collections run until the end of that day
+                return datetime.strptime(stamp, '%Y%m%d') + timedelta(days=1)
+            return datetime.strptime(stamp, '%Y%m%d_%H%M%S')
+        except ValueError:
+            # Not named by _save_hot_posts
+            return datetime.fromtimestamp(file_path.stat().st_mtime)
+    
+    def _count_collections(self) -> int:
+        """Count collections across the daily logs and older snapshots"""
+        total = len(list(self.realtime_dir.glob('hot_posts_*.json')))
+        
+        counts = {}
+        for log_file in self.realtime_dir.glob('hot_posts_*.jsonl'):
+            counts[log_file] = self._count_log_collections(log_file)
+            total += counts[log_file][1]
+        
+        # Forget logs removed by cleanup_old_hot_posts
+        self._collection_counts = counts
+        return total
+    
+    def _count_log_collections(self, log_file: Path) -> Tuple[int, int]:
+        """(bytes counted, collections) of a daily log, scanning only bytes appended since the last count"""
+        counted, count = self._collection_counts.get(log_file, (0, 0))
+        if log_file.stat().st_size == counted:
+            return counted, count
+        
+        with mapped_file(log_file) as raw:
+            if len(raw) < counted:
+                # Rewritten rather than appended to: count from the start
+                counted, count = 0, 0
+            
+            position = raw.find(_COLLECTION_HEADER, counted)
+            while position >= 0:
+                # Headers always start a line
+                if position == 0 or raw[position - 1] == ord('\n'):
+                    count += 1
+                position = raw.find(_COLLECTION_HEADER, position + 1)
+            
+            return len(raw), count
+    
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get real-time collection statistics"""
-        hot_post_files = list(self.realtime_dir.glob('hot_posts_*.json'))
-        
         stats = {
-            'total_collections': len(hot_post_files),
+            'total_collections': self._count_collections(),
             'latest_collection': None,
             'platforms': {}
         }
         
-        if hot_post_files:
-            # Get the most recent file
-            latest_file = max(hot_post_files, key=lambda f: f.stat().st_mtime)
-            stats['latest_collection'] = latest_file.name
-            
+        if stats['total_collections']:
             try:
-                with open(latest_file, 'r') as f:
-                    data = json.load(f)
-                    platforms = data.get('platforms', {})
-                    
-                    for platform, posts in platforms.items():
-                        stats['platforms'][platform] = {
-                            'posts_count': len(posts),
-                            'latest_post_time': max(
-                                (post.get('timestamp', '') for post in posts),
-                                default=''
-                            )
-                        }
+                collection_time, platforms = self._load_latest_collection()
+                stats['latest_collection'] = collection_time
+                
+                for platform, posts in platforms.items():
+                    stats['platforms'][platform] = {
+                        'posts_count': len(posts),
+                        'latest_post_time': max(
+                            (post.get('timestamp', '') for post in posts),
+                            default=''
+                        )
+                    }
             except Exception as e:
                 self.logger.error(f"Error reading latest collection stats: {e}")
         
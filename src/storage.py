@@ -3,18 +3,33 @@ Storage system for BuzzScope using Parquet format
 """
 import os
 import pandas as pd
-from datetime import datetime, date
-from typing import List, Dict, Any, Optional, Union
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta
+from typing import List, Dict, Any, Optional, Tuple, Union
 import logging
 from pathlib import Path
 from .models import BasePost, PLATFORM_MODELS
 from .config import Config
+from .keyword_matcher import compile_word_pattern
 
 logger = logging.getLogger(__name__)
 
+# Threads reading Parquet files side by side (PyArrow releases the GIL while
+# reading and decompressing, so I/O and decoding of several files overlap)
+READ_WORKERS = 8
+
 class BuzzScopeStorage:
     """Storage manager for BuzzScope data using Parquet format"""
     
+    # Low-cardinality string columns kept as pandas categoricals (Arrow dictionaries).
+    # Authors stay plain strings: value_counts on a categorical also lists authors
+    # filtered out of a frame and orders ties by category instead of appearance.
+    CATEGORY_COLUMNS = ('platform', 'subreddit', 'channel_id')
+    
     def __init__(self, data_dir: Optional[str] = None):
         self.data_dir = Path(data_dir or Config.DATA_DIR)
         self.ensure_directories()
@@ -55,10 +70,13 @@ class BuzzScopeStorage:
         
         # Create file path with partitioning
         file_path = self._get_file_path(platform, partition_date)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Save to Parquet
         try:
-            df.to_parquet(file_path, index=False, compression='snappy')
+            # Zstd level 3 compresses the text-heavy columns much better than Snappy at
+            # similar decode speed; pyarrow dictionary-encodes low-cardinality columns by default
+            df.to_parquet(file_path, index=False, compression='zstd', compression_level=3)
             logger.info(f"Saved {len(posts)} posts to {file_path}")
             return str(file_path)
         except Exception as e:
@@ -85,27 +103,36 @@ class BuzzScopeStorage:
             return pd.DataFrame()
         
         # Find all Parquet files for the platform
-        parquet_files = list(platform_dir.glob("*.parquet"))
+        parquet_files = self._list_parquet_files(platform_dir)
         
         if not parquet_files:
             logger.warning(f"No Parquet files found for platform {platform}")
             return pd.DataFrame()
         
-        # Load and combine all files
-        dfs = []
-        for file_path in parquet_files:
-            try:
-                df = pd.read_parquet(file_path)
-                dfs.append(df)
-            except Exception as e:
-                logger.error(f"Error loading {file_path}: {e}")
-                continue
-        
-        if not dfs:
-            return pd.DataFrame()
+        if start_date or end_date:
+            # Skip files whose timestamps all fall outside the date range
+            parquet_files = [
+                file_path for file_path in parquet_files
+                if self._may_overlap(file_path, start_date, end_date)
+            ]
+            if not parquet_files:
+                return pd.DataFrame()
         
-        # Combine all DataFrames
-        combined_df = pd.concat(dfs, ignore_index=True)
+        # Load all files as one Arrow dataset, filtering by date while reading
+        try:
+            combined_df = self._read_dataset(parquet_files, start_date, end_date)
+        except Exception as e:
+            # Schemas that can't be combined or unreadable files: read file by file
+            logger.warning(f"Reading {platform} files individually: {e}")
+            
+            # Combine the readable files as they are read, without collecting them first
+            with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(parquet_files))) as executor:
+                frames = executor.map(self._read_parquet_file, parquet_files)
+                try:
+                    combined_df = pd.concat((df for df in frames if df is not None), ignore_index=True)
+                except ValueError:
+                    # No file could be read
+                    return pd.DataFrame()
         
         # Convert timestamp column to datetime
         if 'timestamp' in combined_df.columns:
@@ -119,9 +146,86 @@ class BuzzScopeStorage:
                 if end_date:
                     combined_df = combined_df[combined_df['timestamp'].dt.date <= end_date]
         
+        combined_df = self._as_categories(combined_df)
+        
         logger.info(f"Loaded {len(combined_df)} posts for platform {platform}")
         return combined_df
     
+    def _read_parquet_file(self, file_path: Path) -> Optional[pd.DataFrame]:
+        """Read one Parquet file, logging and returning None if it can't be read"""
+        try:
+            return pd.read_parquet(file_path)
+        except Exception as e:
+            logger.error(f"Error loading {file_path}: {e}")
+            return None
+    
+    def _may_overlap(self, file_path: Path, start_date: Optional[date], end_date: Optional[date]) -> bool:
+        """Check from a file's footer statistics whether it may hold posts in the date range"""
+        try:
+            _, first, last = self._parquet_file_stats(file_path)
+        except Exception:
+            # Let the actual read report unreadable files
+            return True
+        
+        if first is None:
+            return True
+        if start_date and last.date() < start_date:
+            return False
+        if end_date and first.date() > end_date:
+            return False
+        return True
+    
+    @staticmethod
+    def _normalize_schema(schema: pa.Schema) -> pa.Schema:
+        """
+        Scan dictionary fields as their plain value type, and large strings as
+        strings, so files written with different dictionary index widths or
+        string types still merge into one dataset schema
+        """
+        fields = []
+        for field in schema:
+            field_type = field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+            if pa.types.is_large_string(field_type):
+                field_type = pa.string()
+            fields.append(pa.field(field.name, field_type, field.nullable, field.metadata))
+        return pa.schema(fields, metadata=schema.metadata)
+    
+    def _as_categories(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the low-cardinality columns of a (final, filtered) frame to categoricals"""
+        for column in self.CATEGORY_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+        return df
+    
+    def _read_dataset(self, parquet_files: List[Path], start_date: Optional[date] = None,
+                      end_date: Optional[date] = None) -> pd.DataFrame:
+        """
+        Read Parquet files into a single DataFrame through one Arrow dataset scan
+        
+        ISO timestamp strings (as written by save_posts) start with the date,
+        so date bounds are applied as string comparisons while scanning.
+        """
+        schema = pa.unify_schemas([
+            self._normalize_schema(pq.read_schema(file_path)) for file_path in parquet_files
+        ])
+        dataset = ds.dataset([str(file_path) for file_path in parquet_files], schema=schema, format='parquet')
+        
+        row_filter = None
+        if 'timestamp' in schema.names:
+            timestamp_type = schema.field('timestamp').type
+            if pa.types.is_string(timestamp_type) or pa.types.is_large_string(timestamp_type):
+                timestamp = ds.field('timestamp')
+                bounds = []
+                if start_date:
+                    bounds.append(timestamp >= start_date.isoformat())
+                if end_date:
+                    bounds.append(timestamp < (end_date + timedelta(days=1)).isoformat())
+                for bound in bounds:
+                    row_filter = bound if row_filter is None else row_filter & bound
+        
+        table = dataset.to_table(filter=row_filter)
+        return table.to_pandas(self_destruct=True)
+    
     def search_posts(self, keyword: str, platforms: Optional[List[str]] = None,
                      start_date: Optional[date] = None, 
                      end_date: Optional[date] = None,
@@ -147,31 +251,33 @@ class BuzzScopeStorage:
         
         for platform in platforms:
             try:
-                df = self.load_posts(platform, start_date, end_date)
+                df = self._load_keyword_candidates(platform, keyword_lower)
                 
                 if df.empty:
                     continue
                 
-                # Search in title and content columns
+                # Same conversion and date filtering as load_posts, on the candidates only
+                if 'timestamp' in df.columns:
+                    df['timestamp'] = pd.to_datetime(df['timestamp'])
+                    if start_date:
+                        df = df[df['timestamp'].dt.date >= start_date]
+                    if end_date:
+                        df = df[df['timestamp'].dt.date <= end_date]
+                
                 if exact_match:
-                    # Use regex for exact phrase matching
-                    import re
-                    escaped_keyword = re.escape(keyword_lower)
-                    pattern = r'\b' + escaped_keyword + r'\b'
+                    # Use regex for exact phrase matching (compiled once per keyword)
+                    pattern = compile_word_pattern(keyword_lower)
                     mask = (
                         df['title'].str.lower().str.contains(pattern, regex=True, na=False) |
                         df['content'].str.lower().str.contains(pattern, regex=True, na=False)
                     )
+                    matching_posts = df[mask]
                 else:
-                    # Use substring matching
-                    mask = (
-                        df['title'].str.lower().str.contains(keyword_lower, na=False) |
-                        df['content'].str.lower().str.contains(keyword_lower, na=False)
-                    )
+                    # Candidates already contain the keyword as a substring
+                    matching_posts = df
                 
-                matching_posts = df[mask]
                 if not matching_posts.empty:
-                    results[platform] = matching_posts
+                    results[platform] = self._as_categories(matching_posts)
                     logger.info(f"Found {len(matching_posts)} posts mentioning '{keyword}' in {platform}")
                 
             except Exception as e:
@@ -180,6 +286,54 @@ class BuzzScopeStorage:
         
         return results
     
+    def _load_keyword_candidates(self, platform: str, keyword_lower: str) -> pd.DataFrame:
+        """
+        Load only the posts whose title or content contains keyword_lower
+        
+        Each file's text columns are scanned with Arrow first; the remaining
+        columns are read, and rows converted to pandas, only for files with
+        matches. Rows keep the index they would have in load_posts.
+        """
+        platform_dir = self.data_dir / platform
+        if not platform_dir.exists():
+            return pd.DataFrame()
+        
+        frames = []
+        offset = 0
+        
+        for file_path in self._list_parquet_files(platform_dir):
+            try:
+                parquet_file = pq.ParquetFile(file_path)
+                num_rows = parquet_file.metadata.num_rows
+                
+                text_columns = [
+                    field.name for field in parquet_file.schema_arrow
+                    if field.name in ('title', 'content')
+                    and (pa.types.is_string(field.type) or pa.types.is_large_string(field.type))
+                ]
+                if text_columns:
+                    texts = parquet_file.read(columns=text_columns)
+                    mask = None
+                    for column in text_columns:
+                        # Case-insensitive scan in one pass, without a lowercased copy of the column
+                        hit = pc.fill_null(pc.match_substring(texts[column], keyword_lower, ignore_case=True), False)
+                        mask = hit if mask is None else pc.or_(mask, hit)
+                    
+                    indices = pc.indices_nonzero(mask)
+                    if len(indices):
+                        df = parquet_file.read().take(indices).to_pandas()
+                        df.index = indices.cast(pa.int64()).to_numpy() + offset
+                        frames.append(df)
+                
+                offset += num_rows
+            except Exception as e:
+                logger.error(f"Error loading {file_path}: {e}")
+                continue
+        
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames)
+    
     def get_storage_stats(self) -> Dict[str, Any]:
         """Get statistics about stored data"""
         stats = {
@@ -189,29 +343,33 @@ class BuzzScopeStorage:
             'date_range': None
         }
         
-        all_timestamps = []
+        overall_range = None
         
         for platform in PLATFORM_MODELS.keys():
             platform_dir = self.data_dir / platform
             if not platform_dir.exists():
                 continue
             
-            parquet_files = list(platform_dir.glob("*.parquet"))
+            parquet_files = self._list_parquet_files(platform_dir)
             if not parquet_files:
                 continue
             
             platform_posts = 0
-            platform_timestamps = []
+            platform_range = None
+            
+            # Read the file footers concurrently
+            with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(parquet_files))) as executor:
+                futures = [executor.submit(self._parquet_file_stats, file_path) for file_path in parquet_files]
             
-            for file_path in parquet_files:
+            for file_path, future in zip(parquet_files, futures):
                 try:
-                    df = pd.read_parquet(file_path)
-                    platform_posts += len(df)
+                    num_rows, first, last = future.result()
+                    platform_posts += num_rows
                     
-                    if 'timestamp' in df.columns:
-                        timestamps = pd.to_datetime(df['timestamp'])
-                        platform_timestamps.extend(timestamps.tolist())
-                        all_timestamps.extend(timestamps.tolist())
+                    # Per-file endpoints are enough for the running min/max
+                    if first is not None:
+                        platform_range = self._widen_range(platform_range, first, last)
+                        overall_range = self._widen_range(overall_range, first, last)
                         
                 except Exception as e:
                     logger.error(f"Error reading stats from {file_path}: {e}")
@@ -222,30 +380,71 @@ class BuzzScopeStorage:
                     'total_posts': platform_posts,
                     'files': len(parquet_files),
                     'date_range': (
-                        min(platform_timestamps).date() if platform_timestamps else None,
-                        max(platform_timestamps).date() if platform_timestamps else None
+                        (platform_range[0].date(), platform_range[1].date())
+                        if platform_range else (None, None)
                     )
                 }
                 stats['total_platforms'] += 1
                 stats['total_posts'] += platform_posts
         
-        if all_timestamps:
-            # Handle timezone-aware and timezone-naive timestamps
-            try:
-                stats['date_range'] = (
-                    min(all_timestamps).date(),
-                    max(all_timestamps).date()
-                )
-            except TypeError:
-                # If there's a timezone mismatch, convert all to naive
-                naive_timestamps = [ts.tz_localize(None) if ts.tz is not None else ts for ts in all_timestamps]
-                stats['date_range'] = (
-                    min(naive_timestamps).date(),
-                    max(naive_timestamps).date()
-                )
+        if overall_range:
+            stats['date_range'] = (overall_range[0].date(), overall_range[1].date())
         
         return stats
     
+    @staticmethod
+    def _widen_range(date_range: Optional[Tuple[pd.Timestamp, pd.Timestamp]],
+                     first: pd.Timestamp, last: pd.Timestamp) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """Extend a running (min, max) timestamp range with a file's endpoints"""
+        if date_range is None:
+            return first, last
+        
+        # Handle timezone-aware and timezone-naive timestamps
+        try:
+            return min(date_range[0], first), max(date_range[1], last)
+        except TypeError:
+            # If there's a timezone mismatch, compare them all as naive
+            low, high, first, last = (
+                ts.tz_localize(None) if ts.tz is not None else ts
+                for ts in (*date_range, first, last)
+            )
+            return min(low, first), max(high, last)
+    
+    def _parquet_file_stats(self, file_path: Path) -> Tuple[int, Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+        """
+        Get the row count and timestamp range of a Parquet file from its footer
+        
+        Row counts and per-row-group min/max statistics are read from the file
+        metadata; the timestamp column is only read if statistics are missing.
+        ISO timestamp strings written by save_posts sort chronologically.
+        """
+        parquet_file = pq.ParquetFile(file_path)
+        metadata = parquet_file.metadata
+        
+        columns = [metadata.schema.column(i).path for i in range(metadata.num_columns)]
+        if 'timestamp' not in columns:
+            return metadata.num_rows, None, None
+        column_index = columns.index('timestamp')
+        
+        lows, highs = [], []
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            statistics = row_group.column(column_index).statistics
+            
+            if statistics is not None and statistics.has_min_max:
+                lows.append(statistics.min)
+                highs.append(statistics.max)
+            elif statistics is None or statistics.null_count != row_group.num_rows:
+                # No usable statistics, read just the timestamp column
+                timestamps = pd.to_datetime(parquet_file.read(columns=['timestamp']).column(0).to_pandas())
+                if timestamps.isna().all():
+                    return metadata.num_rows, None, None
+                return metadata.num_rows, timestamps.min(), timestamps.max()
+        
+        if not lows:
+            return metadata.num_rows, None, None
+        return metadata.num_rows, pd.to_datetime(min(lows)), pd.to_datetime(max(highs))
+    
     def save_analysis_results(self, results: Dict[str, Any], 
                              analysis_name: str) -> str:
         """Save analysis results to storage"""
@@ -276,13 +475,49 @@ class BuzzScopeStorage:
             post_dict = post.to_dict()
             data.append(post_dict)
         
-        return pd.DataFrame(data)
+        return self._as_categories(pd.DataFrame(data))
     
     def _get_file_path(self, platform: str, partition_date: date) -> Path:
-        """Get file path for storing posts with partitioning"""
+        """Get file path for storing posts with Hive-style date partitioning"""
         platform_dir = self.data_dir / platform
-        filename = f"{platform}_{partition_date.strftime('%Y%m%d')}.parquet"
-        return platform_dir / filename
+        return platform_dir / f"date={partition_date.isoformat()}" / "part.parquet"
+    
+    def _list_parquet_files(self, platform_dir: Path) -> List[Path]:
+        """List a platform's Parquet files in the partitioned and the legacy flat layout"""
+        return list(platform_dir.glob("date=*/*.parquet")) + list(platform_dir.glob("*.parquet"))
+    
+    def migrate_to_partitioned_layout(self) -> int:
+        """
+        Move legacy {platform}/{platform}_YYYYMMDD.parquet files into the
+        {platform}/date=YYYY-MM-DD/part.parquet layout
+        
+        Returns:
+            Number of files moved
+        """
+        moved = 0
+        
+        for platform in PLATFORM_MODELS.keys():
+            platform_dir = self.data_dir / platform
+            if not platform_dir.exists():
+                continue
+            
+            for file_path in platform_dir.glob(f"{platform}_*.parquet"):
+                try:
+                    file_date = datetime.strptime(file_path.stem.split('_')[-1], '%Y%m%d').date()
+                    target = self._get_file_path(platform, file_date)
+                    if target.exists():
+                        logger.warning(f"Not migrating {file_path}: {target} already exists")
+                        continue
+                    
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(file_path, target)
+                    moved += 1
+                except Exception as e:
+                    logger.error(f"Error migrating {file_path}: {e}")
+                    continue
+        
+        logger.info(f"Migrated {moved} Parquet files to the partitioned layout")
+        return moved
     
     def cleanup_old_files(self, days_to_keep: int = 90):
         """Clean up old Parquet files to save space"""
@@ -293,15 +528,21 @@ class BuzzScopeStorage:
             if not platform_dir.exists():
                 continue
             
-            for file_path in platform_dir.glob("*.parquet"):
+            for file_path in self._list_parquet_files(platform_dir):
                 try:
-                    # Extract date from filename
-                    filename = file_path.stem
-                    date_str = filename.split('_')[-1]  # Get date part
-                    file_date = datetime.strptime(date_str, '%Y%m%d').date()
+                    if file_path.parent.name.startswith('date='):
+                        # Extract date from the partition directory
+                        file_date = date.fromisoformat(file_path.parent.name[len('date='):])
+                    else:
+                        # Extract date from filename
+                        filename = file_path.stem
+                        date_str = filename.split('_')[-1]  # Get date part
+                        file_date = datetime.strptime(date_str, '%Y%m%d').date()
                     
                     if file_date < cutoff_date:
                         file_path.unlink()
+                        if file_path.parent != platform_dir and not any(file_path.parent.iterdir()):
+                            file_path.parent.rmdir()
                         logger.info(f"Deleted old file: {file_path}")
                         
                 except Exception as e:
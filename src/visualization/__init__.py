@@ -1,11 +1,25 @@
 """
 Visualization components for BuzzScope
 """
-from .chart_factory import ChartFactory
-from .dashboard_components import DashboardComponents
+import importlib
+
+# Exported name -> submodule defining it. Submodules are imported on first
+# access, so importing one visualization module doesn't load every other
+# module's Plotly/pandas dependencies.
+_EXPORTS = {
+    'ChartFactory': '.chart_factory',
+    'DashboardComponents': '.dashboard_components'
+}
 
 __all__ = [
     'ChartFactory',
     'DashboardComponents'
 ]
 
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
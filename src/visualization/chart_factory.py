@@ -7,8 +7,17 @@ import plotly.express as px
 import plotly.graph_objects as go
 from typing import Dict, List, Any, Optional
 
+# Seconds a built figure is reused across Streamlit reruns with the same inputs
+FIGURE_CACHE_TTL = 3600
+
 class ChartFactory:
-    """Factory for creating common chart types"""
+    """
+    Factory for creating common chart types
+    
+    Figure builders are cached with ``st.cache_data``: Streamlit reruns the
+    whole script on every interaction, and identical inputs return a copy of
+    the figure built earlier instead of running Plotly Express again.
+    """
     
     @staticmethod
     def create_metric_cards(metrics: Dict[str, Any], columns: int = 4) -> None:
@@ -33,6 +42,7 @@ class ChartFactory:
                 st.metric(key, display_value)
     
     @staticmethod
+    @st.cache_data(ttl=FIGURE_CACHE_TTL, show_spinner=False)
     def create_bar_chart(data: pd.DataFrame, x: str, y: str, title: str, 
                         color: Optional[str] = None) -> go.Figure:
         """Create a bar chart"""
@@ -55,6 +65,7 @@ class ChartFactory:
         return fig
     
     @staticmethod
+    @st.cache_data(ttl=FIGURE_CACHE_TTL, show_spinner=False)
     def create_line_chart(data: pd.DataFrame, x: str, y: str, title: str,
                          color: Optional[str] = None) -> go.Figure:
         """Create a line chart"""
@@ -77,6 +88,7 @@ class ChartFactory:
         return fig
     
     @staticmethod
+    @st.cache_data(ttl=FIGURE_CACHE_TTL, show_spinner=False)
     def create_pie_chart(data: pd.DataFrame, names: str, values: str, title: str) -> go.Figure:
         """Create a pie chart"""
         fig = px.pie(
@@ -92,6 +104,7 @@ class ChartFactory:
         return fig
     
     @staticmethod
+    @st.cache_data(ttl=FIGURE_CACHE_TTL, show_spinner=False)
     def create_platform_comparison_chart(platform_data: List[Dict[str, Any]], 
                                        metric: str, title: str) -> go.Figure:
         """Create platform comparison chart"""
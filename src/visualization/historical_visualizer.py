@@ -4,24 +4,196 @@ Historical Data Visualization Components
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import pandas as pd
-from typing import Dict, List, Any
+import numpy as np
+from collections import defaultdict
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple
 from datetime import datetime
 import json
 
+# Plotly 和 pandas 在用到它们的函数里再导入（延迟导入），只导入本模块不必承担其加载时间
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# 未配置颜色的平台使用的颜色
+DEFAULT_COLOR = '#000000'
+
+# 数据点达到该数量时使用 WebGL 渲染 (Scattergl)
+WEBGL_MIN_POINTS = 1000
+
+# 跨重跑缓存的图表数量上限
+FIGURE_CACHE_ENTRIES = 64
+
+# 多关键词对比表的列
+COMPARISON_COLUMNS = ['keyword', 'platform', 'posts', 'interactions', 'authors']
+
+# 跨平台对比图的指标：(平台总计中的字段, 子图标题, 柱状图名称)
+COMPARISON_METRICS = [
+    ('total_posts', 'Total Posts', 'Posts'),
+    ('total_interactions', 'Total Interactions', 'Interactions'),
+    ('unique_authors', 'Unique Authors', 'Authors')
+]
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _sorted_mentions(mentions: Dict[str, int]) -> Tuple[List[str], np.ndarray]:
+    """按日期排序的提及次数序列，返回 (日期列表, 计数数组)（Streamlit 重跑时输入不变则直接复用）"""
+    periods = np.array(list(mentions.keys()), dtype=str)
+    counts = np.fromiter(mentions.values(), dtype=np.int64, count=len(mentions))
+    
+    # ISO 日期/周字符串按字典序即时间顺序
+    order = np.argsort(periods, kind='stable')
+    
+    # 日期以列表返回：Plotly 会把字符串数组转成 object 数组，orjson 无法直接序列化，
+    # st.plotly_chart 就会退回逐元素清洗的慢路径；计数保留 int64 数组，由 orjson 原生序列化
+    return periods[order].tolist(), counts[order]
+
+def _scatter_type(counts: np.ndarray):
+    """长序列使用 WebGL 渲染，短序列保留 SVG"""
+    import plotly.graph_objects as go
+    
+    return go.Scattergl if len(counts) >= WEBGL_MIN_POINTS else go.Scatter
+
+# 以下图表构建函数用 st.cache_resource 缓存：输入不变时直接复用同一个 Figure 对象，
+# 跳过 Plotly 的构建和校验。返回的图表在重跑之间共享，调用方不要修改它。
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _build_trend_fig(daily_mentions: Dict[str, int], weekly_mentions: Dict[str, int],
+                     color: str, platform_title: str) -> 'go.Figure':
+    """构建每日/每周提及趋势图"""
+    from plotly.subplots import make_subplots
+    
+    # 创建子图
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Daily Mentions', 'Weekly Mentions'),
+        vertical_spacing=0.1
+    )
+    
+    # 两条曲线共用同一线条样式（Plotly 添加轨迹时会各自复制）
+    line = dict(color=color)
+    
+    # 每日提及图
+    if daily_mentions:
+        dates, counts = _sorted_mentions(daily_mentions)
+        
+        fig.add_trace(
+            _scatter_type(counts)(
+                x=dates,
+                y=counts,
+                mode='lines+markers',
+                name='Daily',
+                line=line
+            ),
+            row=1, col=1
+        )
+    
+    # 每周提及图
+    if weekly_mentions:
+        weeks, counts = _sorted_mentions(weekly_mentions)
+        
+        fig.add_trace(
+            _scatter_type(counts)(
+                x=weeks,
+                y=counts,
+                mode='lines+markers',
+                name='Weekly',
+                line=line
+            ),
+            row=2, col=1
+        )
+    
+    fig.update_layout(
+        height=600,
+        showlegend=False,
+        title=f"Trend Analysis for {platform_title}"
+    )
+    
+    return fig
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _build_comparison_fig(platform_data: Dict[str, Dict[str, int]], colors: Tuple[str, ...]) -> 'go.Figure':
+    """构建跨平台总计对比图"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    platforms = list(platform_data.keys())
+    
+    fig = make_subplots(
+        rows=1, cols=len(COMPARISON_METRICS),
+        subplot_titles=[title for _, title, _ in COMPARISON_METRICS]
+    )
+    
+    # 三个指标的柱状图一次性加入，Plotly 只校验和重排一次 fig.data；
+    # 各指标量级不同，仍分三栏各用独立 y 轴
+    fig.add_traces(
+        [
+            go.Bar(
+                x=platforms,
+                y=[platform_data[p][column] for p in platforms],
+                name=name,
+                marker_color=colors
+            )
+            for column, _, name in COMPARISON_METRICS
+        ],
+        rows=1,
+        cols=list(range(1, len(COMPARISON_METRICS) + 1))
+    )
+    
+    fig.update_layout(
+        height=400,
+        showlegend=False,
+        title="Cross-Platform Comparison"
+    )
+    
+    return fig
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _build_keyword_rank_fig(top_keywords: List[Tuple[str, int]]) -> 'go.Figure':
+    """构建关键词排名图"""
+    import plotly.graph_objects as go
+    
+    # 直接取出两列，省去 zip(*...) 转置出的元组再转列表
+    keywords = list(map(itemgetter(0), top_keywords))
+    counts = list(map(itemgetter(1), top_keywords))
+    
+    fig = go.Figure(data=[
+        go.Bar(x=keywords, y=counts, marker_color='lightblue')
+    ])
+    
+    fig.update_layout(
+        title="Total Mentions by Keyword",
+        xaxis_title="Keywords",
+        yaxis_title="Total Posts"
+    )
+    
+    return fig
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _build_multi_keyword_fig(rows: Tuple[Tuple[str, str, int, int, int], ...]) -> 'go.Figure':
+    """构建多关键词按平台对比图（以行元组作为缓存键，比对 DataFrame 求哈希更省）"""
+    import pandas as pd
+    import plotly.express as px
+    
+    return px.bar(
+        pd.DataFrame.from_records(rows, columns=COMPARISON_COLUMNS), 
+        x='platform', 
+        y='posts', 
+        color='keyword',
+        title='Posts by Platform and Keyword',
+        barmode='group'
+    )
+
 class HistoricalVisualizer:
     """历史数据可视化器"""
     
     def __init__(self):
-        self.color_palette = {
+        # 未知平台使用默认颜色
+        self.color_palette = defaultdict(lambda: DEFAULT_COLOR, {
             'hackernews': '#FF6600',
             'reddit': '#FF4500', 
             'youtube': '#FF0000',
             'discord': '#5865F2'
-        }
+        })
     
     def display_platform_overview(self, metrics: Dict[str, Any]):
         """显示平台概览"""
@@ -69,24 +241,24 @@ class HistoricalVisualizer:
         
         st.subheader(f"🏆 Top Contributors - {platform.title()}")
         
-        # 创建DataFrame
-        df = pd.DataFrame(contributors)
+        import pandas as pd
         
-        # 显示表格，包含链接
-        for i, contributor in enumerate(contributors[:10]):
-            col1, col2, col3 = st.columns([3, 1, 1])
-            
-            with col1:
-                if contributor.get('profile_url'):
-                    st.markdown(f"[{contributor['author']}]({contributor['profile_url']})")
-                else:
-                    st.write(contributor['author'])
-            
-            with col2:
-                st.write(f"{contributor['post_count']} posts")
-            
-            with col3:
-                st.write(platform.title())
+        # 一次性渲染为表格，而不是逐行创建列和文本组件
+        df = pd.DataFrame(contributors[:10]).reindex(columns=['author', 'post_count', 'profile_url'])
+        df.insert(2, 'platform', platform.title())
+        df['profile_url'] = df['profile_url'].replace('', None)  # 没有主页的作者不显示链接
+        
+        st.dataframe(
+            df,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'author': st.column_config.TextColumn("Author"),
+                'post_count': st.column_config.NumberColumn("Posts"),
+                'platform': st.column_config.TextColumn("Platform"),
+                'profile_url': st.column_config.LinkColumn("Profile", display_text="View Profile")
+            }
+        )
     
     def display_top_posts(self, posts: List[Dict[str, Any]], platform: str):
         """显示Top帖子"""
@@ -96,19 +268,24 @@ class HistoricalVisualizer:
         
         st.subheader(f"🔥 Top Posts - {platform.title()}")
         
-        for i, post in enumerate(posts[:10]):
-            with st.expander(f"#{i+1} {post['title'][:50]}..."):
-                col1, col2 = st.columns([3, 1])
-                
-                with col1:
-                    st.write(f"**Title:** {post['title']}")
-                    st.write(f"**Author:** {post['author']}")
-                    st.write(f"**Date:** {post['created_at']}")
-                
-                with col2:
-                    st.write(f"**Interactions:** {post['interactions']}")
-                    if post.get('url'):
-                        st.markdown(f"[View Post]({post['url']})")
+        import pandas as pd
+        
+        # 一次性渲染为表格，而不是逐帖创建折叠面板
+        df = pd.DataFrame(posts[:10]).reindex(columns=['title', 'author', 'created_at', 'interactions', 'url'])
+        df['url'] = df['url'].replace('', None)
+        
+        st.dataframe(
+            df,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'title': st.column_config.TextColumn("Title"),
+                'author': st.column_config.TextColumn("Author"),
+                'created_at': st.column_config.TextColumn("Date"),
+                'interactions': st.column_config.NumberColumn("Interactions"),
+                'url': st.column_config.LinkColumn("Link", display_text="View Post")
+            }
+        )
     
     def display_trend_analysis(self, daily_mentions: Dict[str, int], weekly_mentions: Dict[str, int], platform: str):
         """显示趋势分析"""
@@ -118,51 +295,12 @@ class HistoricalVisualizer:
             st.info("No trend data available")
             return
         
-        # 创建子图
-        fig = make_subplots(
-            rows=2, cols=1,
-            subplot_titles=('Daily Mentions', 'Weekly Mentions'),
-            vertical_spacing=0.1
+        fig = _build_trend_fig(
+            daily_mentions,
+            weekly_mentions,
+            self.color_palette[platform],
+            platform.title()
         )
-        
-        # 每日提及图
-        if daily_mentions:
-            dates = sorted(daily_mentions.keys())
-            counts = [daily_mentions[date] for date in dates]
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=dates,
-                    y=counts,
-                    mode='lines+markers',
-                    name='Daily',
-                    line=dict(color=self.color_palette.get(platform, '#000000'))
-                ),
-                row=1, col=1
-            )
-        
-        # 每周提及图
-        if weekly_mentions:
-            weeks = sorted(weekly_mentions.keys())
-            counts = [weekly_mentions[week] for week in weeks]
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=weeks,
-                    y=counts,
-                    mode='lines+markers',
-                    name='Weekly',
-                    line=dict(color=self.color_palette.get(platform, '#000000'))
-                ),
-                row=2, col=1
-            )
-        
-        fig.update_layout(
-            height=600,
-            showlegend=False,
-            title=f"Trend Analysis for {platform.title()}"
-        )
-        
         st.plotly_chart(fig, use_container_width=True)
     
     def display_keyword_comparison(self, comparison_metrics: Dict[str, Any]):
@@ -175,39 +313,8 @@ class HistoricalVisualizer:
         platform_data = comparison_metrics.get('platform_totals', {})
         if platform_data:
             # 创建对比图
-            platforms = list(platform_data.keys())
-            posts = [platform_data[p]['total_posts'] for p in platforms]
-            interactions = [platform_data[p]['total_interactions'] for p in platforms]
-            authors = [platform_data[p]['unique_authors'] for p in platforms]
-            
-            fig = make_subplots(
-                rows=1, cols=3,
-                subplot_titles=('Total Posts', 'Total Interactions', 'Unique Authors'),
-                specs=[[{"secondary_y": False}, {"secondary_y": False}, {"secondary_y": False}]]
-            )
-            
-            colors = [self.color_palette.get(p, '#000000') for p in platforms]
-            
-            fig.add_trace(
-                go.Bar(x=platforms, y=posts, name='Posts', marker_color=colors),
-                row=1, col=1
-            )
-            
-            fig.add_trace(
-                go.Bar(x=platforms, y=interactions, name='Interactions', marker_color=colors),
-                row=1, col=2
-            )
-            
-            fig.add_trace(
-                go.Bar(x=platforms, y=authors, name='Authors', marker_color=colors),
-                row=1, col=3
-            )
-            
-            fig.update_layout(
-                height=400,
-                showlegend=False,
-                title="Cross-Platform Comparison"
-            )
+            colors = tuple(self.color_palette[p] for p in platform_data)
+            fig = _build_comparison_fig(platform_data, colors)
             
             st.plotly_chart(fig, use_container_width=True)
         
@@ -215,17 +322,7 @@ class HistoricalVisualizer:
         st.write("### Keyword Rankings")
         top_keywords = comparison_metrics.get('top_keywords', [])
         if top_keywords:
-            keywords, counts = zip(*top_keywords)
-            
-            fig = go.Figure(data=[
-                go.Bar(x=list(keywords), y=list(counts), marker_color='lightblue')
-            ])
-            
-            fig.update_layout(
-                title="Total Mentions by Keyword",
-                xaxis_title="Keywords",
-                yaxis_title="Total Posts"
-            )
+            fig = _build_keyword_rank_fig(top_keywords)
             
             st.plotly_chart(fig, use_container_width=True)
         
@@ -272,30 +369,26 @@ class HistoricalVisualizer:
             st.warning("Please select at least one keyword")
             return
         
-        # 创建对比数据
-        comparison_data = []
-        for keyword in selected_keywords:
-            for platform, metrics in keyword_results[keyword].items():
-                comparison_data.append({
-                    'keyword': keyword,
-                    'platform': platform,
-                    'posts': metrics.get('total_posts', 0),
-                    'interactions': metrics.get('total_interactions', 0),
-                    'authors': metrics.get('unique_authors', 0)
-                })
+        # 创建对比数据（每行一个 (关键词, 平台) 组合）
+        rows = tuple(
+            (
+                keyword,
+                platform,
+                metrics.get('total_posts', 0),
+                metrics.get('total_interactions', 0),
+                metrics.get('unique_authors', 0)
+            )
+            for keyword in selected_keywords
+            for platform, metrics in keyword_results[keyword].items()
+        )
         
-        if comparison_data:
-            df = pd.DataFrame(comparison_data)
+        if rows:
+            import pandas as pd
+            
+            df = pd.DataFrame.from_records(rows, columns=COMPARISON_COLUMNS)
             
             # 创建对比图
-            fig = px.bar(
-                df, 
-                x='platform', 
-                y='posts', 
-                color='keyword',
-                title='Posts by Platform and Keyword',
-                barmode='group'
-            )
+            fig = _build_multi_keyword_fig(rows)
             
             st.plotly_chart(fig, use_container_width=True)
             
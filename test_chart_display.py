@@ -4,19 +4,55 @@
 """
 
 import streamlit as st
-import json
 import os
+from typing import Any, Dict
+
+from src.serialization import json_loads
+
+# 图表HTML缺少Plotly.js时注入的脚本
+PLOTLY_SCRIPT = '<script src="https://cdn.plot.ly/plotly-latest.min.js"></script>'
+
+# 检查HTML时每次小写化的字符数
+_PROBE_CHUNK = 1 << 16
+
+# 缓存的图表文件目录
+CHARTS_DIR = "data/cache/charts"
+
+def _scan_chart_files(charts_dir: str = CHARTS_DIR) -> Dict[str, str]:
+    """一次读取目录，得到 文件名 -> 路径，代替逐个文件 os.path.exists"""
+    try:
+        with os.scandir(charts_dir) as entries:
+            return {entry.name: entry.path for entry in entries if entry.name.endswith('.json')}
+    except FileNotFoundError:
+        return {}
+
+CHART_FILES = _scan_chart_files()
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _load_chart(chart_file: str, mtime: float) -> Dict[str, Any]:
+    """解析图表JSON；以修改时间为键，文件不变时跨重跑复用（调用方不要修改返回值）"""
+    with open(chart_file, 'rb') as f:
+        return json_loads(f.read())
+
+def _has_plotly_js(chart_html: str) -> bool:
+    """不区分大小写地查找 'plotly.js'，分块小写化，避免复制整个数MB的HTML"""
+    needle = 'plotly.js'
+    # 每块多带 len(needle)-1 个字符，跨块的匹配也能找到
+    for start in range(0, len(chart_html), _PROBE_CHUNK):
+        if needle in chart_html[start:start + _PROBE_CHUNK + len(needle) - 1].lower():
+            return True
+    return False
 
 def test_chart_display():
     """测试图表显示"""
     st.title("📊 图表显示测试")
     
     # 加载一个图表文件
-    chart_file = "data/cache/charts/reddit_ai_trend.json"
+    chart_name = "reddit_ai_trend.json"
+    chart_file = CHART_FILES.get(chart_name)
     
-    if os.path.exists(chart_file):
-        with open(chart_file, 'r', encoding='utf-8') as f:
-            chart_data = json.load(f)
+    if chart_file is not None:
+        chart_data = _load_chart(chart_file, os.path.getmtime(chart_file))
         
         st.write("### 图表数据:")
         st.json(chart_data['statistics'])
@@ -25,14 +61,13 @@ def test_chart_display():
         chart_html = chart_data['chart_html']
         
         # 添加Plotly.js库
-        if 'plotly.js' not in chart_html.lower():
-            plotly_js = '<script src="https://cdn.plot.ly/plotly-latest.min.js"></script>'
-            chart_html = chart_html.replace('<head>', f'<head>{plotly_js}')
+        if not _has_plotly_js(chart_html):
+            chart_html = chart_html.replace('<head>', f'<head>{PLOTLY_SCRIPT}', 1)
         
         st.components.v1.html(chart_html, height=450)
         
     else:
-        st.error(f"图表文件不存在: {chart_file}")
+        st.error(f"图表文件不存在: {os.path.join(CHARTS_DIR, chart_name)}")
 
 if __name__ == "__main__":
     test_chart_display()
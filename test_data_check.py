@@ -3,7 +3,27 @@
 """
 
 import os
-import json
+from functools import lru_cache
+
+from src.serialization import json_loads
+
+# 可选依赖 - ijson 可以流式读取，读到 total_posts 就停止，不解析整个帖子列表
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+@lru_cache(maxsize=256)
+def _load_total_posts(cache_file: str, mtime: float) -> int:
+    """读取缓存文件中的帖子总数（按路径和修改时间缓存，文件变化后自动重新读取）"""
+    with open(cache_file, 'rb') as f:
+        if ijson is not None:
+            # total_posts 写在 posts 之前，读到即可返回
+            for total_posts in ijson.items(f, 'total_posts'):
+                return total_posts
+            return 0
+        
+        return json_loads(f.read()).get('total_posts', 0)
 
 def test_keyword_status():
     """测试关键词状态检查"""
@@ -13,21 +33,28 @@ def test_keyword_status():
     keywords = ["ai", "iot", "mqtt", "unified_namespace"]
     platforms = ["hackernews", "reddit", "youtube", "discord"]
     
+    # 每个平台目录只读取一次，之后按文件名查找
+    platform_entries = {}
+    for platform in platforms:
+        platform_dir = os.path.join(cache_dir, platform)
+        try:
+            with os.scandir(platform_dir) as entries:
+                platform_entries[platform] = {entry.name: entry for entry in entries}
+        except FileNotFoundError:
+            platform_entries[platform] = {}
+    
     for keyword in keywords:
         print(f"\n📊 检查关键词: {keyword}")
         has_data = False
         
         for platform in platforms:
-            platform_dir = os.path.join(cache_dir, platform)
-            cache_file = os.path.join(platform_dir, f"{keyword}.json")
+            entry = platform_entries[platform].get(f"{keyword}.json")
             
-            if os.path.exists(cache_file):
+            if entry is not None:
                 try:
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        posts_count = data.get('total_posts', 0)
-                        print(f"  ✅ {platform}: {posts_count} posts")
-                        has_data = True
+                    posts_count = _load_total_posts(entry.path, entry.stat().st_mtime)
+                    print(f"  ✅ {platform}: {posts_count} posts")
+                    has_data = True
                 except Exception as e:
                     print(f"  ❌ {platform}: 文件读取错误 - {e}")
             else:
@@ -4,6 +4,7 @@
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 # 直接导入，避免相对导入问题
@@ -18,9 +19,12 @@ def test_historical_analysis():
     
     # 测试数据加载
     print("\n📊 测试数据加载...")
-    for platform in ["reddit", "youtube", "discord"]:
-        for keyword in ["ai", "iot"]:
-            data = analysis_service.load_platform_data(platform, keyword)
+    pairs = [(platform, keyword) for platform in ["reddit", "youtube", "discord"] for keyword in ["ai", "iot"]]
+    
+    # 各文件读取互不依赖（I/O为主），并发加载后按原顺序输出
+    with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+        results = executor.map(lambda pair: analysis_service.load_platform_data(*pair), pairs)
+        for (platform, keyword), data in zip(pairs, results):
             print(f"  {platform}/{keyword}: {data.get('total_posts', 0)} posts")
     
     # 测试指标计算
@@ -7,6 +7,7 @@ import sys
 import os
 import json
 import time
+import threading
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import paho.mqtt.client as mqtt
@@ -22,31 +23,50 @@ class MQTTTester:
         self.connected = False
         self.message_received = False
         self.received_message = None
+        
+        # Set from the callbacks so the test can wait on them instead of polling
+        self.connack_evt = threading.Event()
+        self.subscribed_evt = threading.Event()
+        self.message_evt = threading.Event()
     
-    def on_connect(self, client, userdata, flags, rc):
+    def on_connect(self, client, userdata, flags, reason_code, properties):
         """Callback for when client connects"""
-        if rc == 0:
+        if not reason_code.is_failure:
             print("✅ Connected to MQTT broker successfully")
             self.connected = True
         else:
-            print(f"❌ Failed to connect to MQTT broker. Return code: {rc}")
+            print(f"❌ Failed to connect to MQTT broker. Reason: {reason_code}")
             self.connected = False
+        self.connack_evt.set()
     
-    def on_disconnect(self, client, userdata, rc):
+    def on_disconnect(self, client, userdata, disconnect_flags, reason_code, properties):
         """Callback for when client disconnects"""
         print("🔌 Disconnected from MQTT broker")
         self.connected = False
     
+    def on_subscribe(self, client, userdata, mid, reason_codes, properties):
+        """Callback for when the broker acknowledges a subscription"""
+        self.subscribed_evt.set()
+    
     def on_message(self, client, userdata, msg):
         """Callback for when message is received"""
         print(f"📨 Received message on topic {msg.topic}: {msg.payload.decode()}")
         self.message_received = True
         self.received_message = msg.payload.decode()
+        self.message_evt.set()
     
-    def on_publish(self, client, userdata, mid):
+    def on_publish(self, client, userdata, mid, reason_code, properties):
         """Callback for when message is published"""
         print(f"📤 Message published successfully (mid: {mid})")
     
+    def _loop_until(self, client, event: threading.Event, timeout: float) -> bool:
+        """Run the client's network loop inline until event is set or timeout expires"""
+        deadline = time.monotonic() + timeout
+        while not event.is_set() and time.monotonic() < deadline:
+            if client.loop(timeout=0.1) != mqtt.MQTT_ERR_SUCCESS:
+                break
+        return event.is_set()
+    
     def test_connection(self, broker: str, port: int, username: str = None, 
                        password: str = None, use_tls: bool = False):
         """Test connection to MQTT broker"""
@@ -55,9 +75,10 @@ class MQTTTester:
         print(f"   Auth: {'Yes' if username else 'No'}")
         
         # Create client
-        client = mqtt.Client()
+        client = mqtt.Client(callback_api_version=mqtt.CallbackAPIVersion.VERSION2)
         client.on_connect = self.on_connect
         client.on_disconnect = self.on_disconnect
+        client.on_subscribe = self.on_subscribe
         client.on_message = self.on_message
         client.on_publish = self.on_publish
         
@@ -70,18 +91,15 @@ class MQTTTester:
             if use_tls:
                 client.tls_set()
             
-            # Connect
+            # Connect; the network loop runs inline, no background thread
             client.connect(broker, port, 60)
-            client.loop_start()
             
-            # Wait for connection
-            timeout = 10
-            start_time = time.time()
-            while not self.connected and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
+            # Wait for the broker to answer the connection
+            if not self._loop_until(client, self.connack_evt, timeout=10):
+                print("❌ Connection timeout")
+                return False
             
             if not self.connected:
-                print("❌ Connection timeout")
                 return False
             
             # Test publish/subscribe
@@ -94,7 +112,9 @@ class MQTTTester:
             
             # Subscribe to test topic
             client.subscribe(test_topic, qos=1)
-            time.sleep(1)
+            if not self._loop_until(client, self.subscribed_evt, timeout=5):
+                print("❌ Subscription not acknowledged")
+                return False
             
             # Publish test message
             result = client.publish(test_topic, test_message, qos=1)
@@ -105,9 +125,7 @@ class MQTTTester:
                 return False
             
             # Wait for message to be received
-            time.sleep(2)
-            
-            if self.message_received:
+            if self._loop_until(client, self.message_evt, timeout=3):
                 print("✅ Test message received successfully")
                 return True
             else:
@@ -118,7 +136,6 @@ class MQTTTester:
             print(f"❌ Connection error: {e}")
             return False
         finally:
-            client.loop_stop()
             client.disconnect()
 
 def test_local_mqtt():
@@ -2,10 +2,83 @@
 简单测试历史数据分析功能
 """
 
-import json
 import os
-from datetime import datetime
+from datetime import date
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, List, Mapping
+
+import numpy as np
+
+from src.serialization import json_loads
+
+# 可选依赖 - ijson 可以流式读取，读到 total_posts 就停止，不解析整个帖子列表
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# 可选依赖 - simdjson 按需解析：帖子对象只在读取字段时才转换，不为每个帖子建完整的 dict
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# 并发读取缓存文件的线程数
+LOAD_WORKERS = 8
+
+# 指标计算和趋势分析共用的样本文件
+SAMPLE_FILE = os.path.normpath("data/cache/reddit/ai.json")
+
+def _open_sequential(file_path: str):
+    """以二进制打开文件，并提示内核将顺序读取（加大预读窗口）"""
+    f = open(file_path, 'rb')
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return f
+
+@lru_cache(maxsize=64)
+def _load_cached(file_path: str, mtime: float) -> Mapping[str, Any]:
+    """解析缓存文件（按路径和修改时间缓存，几个测试共用同一次解析；返回值只读）"""
+    with _open_sequential(file_path) as f:
+        raw = f.read()
+    
+    if simdjson is not None:
+        # 每个文件用独立的 Parser，缓存的文档不会被下一次解析覆盖
+        return simdjson.Parser().parse(raw)
+    return json_loads(raw)
+
+def _load_posts(file_path: str):
+    """缓存文件中的帖子列表，多个测试共享同一次解析"""
+    return _load_cached(file_path, os.path.getmtime(file_path)).get('posts', [])
+
+def _load_total_posts(file_path: str, mtime: float, keep_parsed: bool = False) -> int:
+    """读取缓存文件中的帖子总数；keep_parsed 时整体解析并留在缓存中供后面的测试使用"""
+    if ijson is None or keep_parsed:
+        return _load_cached(file_path, mtime).get('total_posts', 0)
+    
+    with _open_sequential(file_path) as f:
+        # total_posts 写在 posts 之前，读到即可返回
+        for total_posts in ijson.items(f, 'total_posts'):
+            return total_posts
+    return 0
+
+def _prefetch(file_paths: List[str]):
+    """一次性提示内核预读所有文件（Linux posix_fadvise），之后各线程的读取多半命中页缓存"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    for file_path in file_paths:
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            continue  # 读取时再报告错误
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
 
 def test_data_loading():
     """测试数据加载"""
@@ -15,19 +88,49 @@ def test_data_loading():
     platforms = ["reddit", "youtube", "discord"]
     keywords = ["ai", "iot", "mqtt", "unified_namespace"]
     
+    # 各文件互不依赖，并发读取，读取等待和解析可以重叠；结果仍按原顺序汇总
+    # 每个平台目录只读取一次，不存在的文件不再逐个 stat；
+    # 按 inode 排序后再读取，同一批写入的文件在磁盘上大多相邻
+    existing = []
+    for platform in platforms:
+        try:
+            with os.scandir(os.path.join(cache_dir, platform)) as entries:
+                platform_entries = {entry.name: entry for entry in entries}
+        except FileNotFoundError:
+            continue
+        
+        for keyword in keywords:
+            entry = platform_entries.get(f"{keyword}.json")
+            if entry is None or not entry.is_file():
+                continue
+            existing.append((entry.inode(), platform, keyword, os.path.normpath(entry.path), entry.stat().st_mtime))
+    existing.sort(key=itemgetter(0))
+    
+    # 没有 ijson 时要整个读入文件，先把所有读取一起交给内核
+    if ijson is None:
+        _prefetch([file_path for _, _, _, file_path, _ in existing])
+    
+    # 样本文件在这里就整体解析，指标和趋势测试直接复用
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        futures = {
+            (platform, keyword): (
+                file_path,
+                executor.submit(_load_total_posts, file_path, mtime, file_path == SAMPLE_FILE)
+            )
+            for _, platform, keyword, file_path, mtime in existing
+        }
+    
     total_posts = 0
     for platform in platforms:
         platform_posts = 0
         for keyword in keywords:
-            file_path = os.path.join(cache_dir, platform, f"{keyword}.json")
-            if os.path.exists(file_path):
+            if (platform, keyword) in futures:
+                file_path, future = futures[(platform, keyword)]
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        posts = data.get('total_posts', 0)
-                        platform_posts += posts
-                        total_posts += posts
-                        print(f"  {platform}/{keyword}: {posts} posts")
+                    posts = future.result()
+                    platform_posts += posts
+                    total_posts += posts
+                    print(f"  {platform}/{keyword}: {posts} posts")
                 except Exception as e:
                     print(f"  Error loading {file_path}: {e}")
         
@@ -41,43 +144,36 @@ def test_metrics_calculation():
     print("\n📈 测试指标计算...")
     
     # 加载一个样本文件
-    file_path = "data/cache/reddit/ai.json"
+    file_path = SAMPLE_FILE
     if not os.path.exists(file_path):
         print("  ❌ 样本文件不存在")
         return False
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        posts = data.get('posts', [])
+        posts = _load_posts(file_path)
         print(f"  📊 加载了 {len(posts)} 个帖子")
         
         if posts:
             # 计算基础指标
             total_posts = len(posts)
-            total_interactions = 0
-            authors = []
             
-            for post in posts:
-                # 计算互动数
-                score = post.get('score', 0)
-                comments = post.get('num_comments', 0)
-                total_interactions += score + comments
-                
-                # 收集作者
-                author = post.get('author', '')
-                if author:
-                    authors.append(author)
+            # 计算互动数：一次遍历取出每帖的 分数+评论数 一列，再用 NumPy 求和
+            interactions = np.fromiter(
+                (post.get('score', 0) + post.get('num_comments', 0) for post in posts),
+                dtype=np.int64,
+                count=total_posts
+            )
+            total_interactions = int(interactions.sum())
             
-            unique_authors = len(set(authors))
+            # 收集作者，计数后的键数即独特作者数
+            author_counts = Counter(author for post in posts if (author := post.get('author', '')))
+            unique_authors = len(author_counts)
             
             print(f"    - 总帖子数: {total_posts}")
             print(f"    - 总互动数: {total_interactions}")
             print(f"    - 独特作者数: {unique_authors}")
             
             # 计算Top贡献者
-            author_counts = Counter(authors)
             top_contributors = author_counts.most_common(5)
             print(f"    - Top贡献者: {top_contributors}")
             
@@ -94,36 +190,33 @@ def test_trend_analysis():
     """测试趋势分析"""
     print("\n📈 测试趋势分析...")
     
-    file_path = "data/cache/reddit/ai.json"
+    file_path = SAMPLE_FILE
     if not os.path.exists(file_path):
         print("  ❌ 样本文件不存在")
         return False
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        posts = data.get('posts', [])
+        posts = _load_posts(file_path)
         if not posts:
             print("  ❌ 没有帖子数据")
             return False
         
-        # 计算每日提及
-        daily_mentions = {}
-        for post in posts:
-            created_at = post.get('created_at', '')
-            if created_at:
-                try:
-                    # 解析日期
-                    date_obj = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    date_str = date_obj.strftime('%Y-%m-%d')
-                    daily_mentions[date_str] = daily_mentions.get(date_str, 0) + 1
-                except:
-                    pass
+        # 计算每日提及：ISO时间戳的前10个字符就是日期，直接截取计数，不逐个解析再格式化
+        daily_mentions = Counter(
+            created_at[:10] for created_at in (post.get('created_at', '') for post in posts)
+            if len(created_at) >= 10 and created_at[4] == '-'
+        )
+        
+        # 每个不同的日期只校验一次，丢弃不是有效日期的前缀
+        for date_str in list(daily_mentions):
+            try:
+                date.fromisoformat(date_str)
+            except ValueError:
+                del daily_mentions[date_str]
         
         print(f"  📅 每日提及数: {len(daily_mentions)} 天")
         if daily_mentions:
-            max_day = max(daily_mentions.items(), key=lambda x: x[1])
+            max_day = daily_mentions.most_common(1)[0]
             print(f"  🔥 最活跃的一天: {max_day[0]} ({max_day[1]} 个帖子)")
         
         return True
@@ -136,6 +229,9 @@ def main():
     """主测试函数"""
     print("🚀 开始测试历史数据分析功能...")
     
+    # 三项测试依次运行：数据加载用线程池并发读文件，并把样本文件的解析留在进程内缓存，
+    # 后两项直接复用。放到多个进程里并行会让每个进程各自重新解析样本文件，实测反而更慢。
+    
     # 测试数据加载
     data_ok = test_data_loading()
     